@@ -35,13 +35,38 @@ class OrganizationSettingsSerializer(serializers.Serializer):
     attribution_window = serializers.IntegerField(required=False, min_value=1, max_value=30)
 
 
-class MembershipSerializer(serializers.ModelSerializer):
-    user = UserSerializer(read_only=True)
+_datetime_field = serializers.DateTimeField()
 
-    class Meta:
-        model = Membership
-        fields = ["id", "user", "role", "created_at"]
-        read_only_fields = ["id", "user", "created_at"]
+
+class MembershipSerializer(serializers.Serializer):
+    """
+    Read-only membership serializer for the members listing hot path.
+
+    The declared fields only describe the schema; to_representation builds
+    the dict directly so DRF doesn't copy and walk the nested UserSerializer
+    fields for every row.
+    """
+
+    id = serializers.IntegerField(read_only=True)
+    user = UserSerializer(read_only=True)
+    role = serializers.ChoiceField(choices=Membership.Role.choices, read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+    def to_representation(self, obj):
+        user = obj.user
+        return {
+            "id": obj.id,
+            "user": {
+                "id": user.id,
+                "clerk_id": user.clerk_id,
+                "email": user.email,
+                "name": user.name,
+                "avatar_url": user.avatar_url,
+                "created_at": _datetime_field.to_representation(user.created_at),
+            },
+            "role": obj.role,
+            "created_at": _datetime_field.to_representation(obj.created_at),
+        }
 
 
 class APIKeySerializer(serializers.ModelSerializer):
@@ -1,8 +1,13 @@
 """Views for accounts API."""
 
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.functions import Now
+from django.http import HttpResponse
 from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 
 from apps.core.permissions import (
@@ -11,6 +16,12 @@ from apps.core.permissions import (
     OrganizationRequiredMixin,
     get_request_organization,
 )
+from apps.accounts.cache import (
+    MEMBERS_CACHE_TTL,
+    invalidate_organization_cache,
+    members_cache_key,
+)
+from apps.core.renderers import ORJSONRenderer
 from apps.accounts.models import Organization, Membership, APIKey
 from .serializers import (
     OrganizationSerializer,
@@ -30,11 +41,13 @@ class OrganizationViewSet(OrganizationRequiredMixin, viewsets.ReadOnlyModelViewS
 
     def get_queryset(self):
         """Return organizations the user is a member of."""
-        user = self.request.user
-        org_ids = Membership.objects.filter(user=user).values_list(
-            "organization_id", flat=True
-        )
-        return Organization.objects.filter(id__in=org_ids)
+        return Organization.objects.filter(memberships__user=self.request.user)
+
+    def list(self, request, *args, **kwargs):
+        """List organizations as plain rows; datetimes are encoded by the renderer."""
+        queryset = self.get_queryset().values(*OrganizationSerializer.Meta.fields).order_by("id")
+        page = self.paginate_queryset(queryset)
+        return self.get_paginated_response(list(page))
 
     @action(detail=False, methods=["get"])
     def current(self, request):
@@ -54,25 +67,56 @@ class OrganizationViewSet(OrganizationRequiredMixin, viewsets.ReadOnlyModelViewS
         serializer = OrganizationSettingsSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        # Merge with existing settings
-        org_settings = organization.settings or {}
-        org_settings.update(serializer.validated_data)
-        organization.settings = org_settings
-        organization.save(update_fields=["settings", "updated_at"])
+        # request.organization may be a cached copy; merge into the locked
+        # current row so a concurrent change isn't overwritten
+        with transaction.atomic():
+            organization = Organization.objects.select_for_update().get(pk=organization.pk)
+            organization.settings = {**(organization.settings or {}), **serializer.validated_data}
+            organization.save(update_fields=["settings"])
+        # The set_updated_at trigger stamped the row in that UPDATE
+        organization.updated_at = timezone.now()
+        invalidate_organization_cache(organization.clerk_org_id)
 
         return Response(OrganizationSerializer(organization).data)
 
     @action(detail=False, methods=["get"])
     def members(self, request):
-        """Get members of the current organization."""
+        """
+        Get members of the current organization.
+
+        Rendered pages are cached per query string and dropped whenever a
+        membership or member changes (see apps.accounts.signals).
+        """
         organization, error_response = self.get_organization_or_error(request)
         if error_response:
             return error_response
 
-        memberships = Membership.objects.filter(
-            organization=organization
-        ).select_related("user")
-        return Response(MembershipSerializer(memberships, many=True).data)
+        cache_key = members_cache_key(organization.id, request.query_params.urlencode())
+        payload = cache.get(cache_key)
+        if payload is not None:
+            return HttpResponse(payload, content_type="application/json")
+
+        memberships = (
+            Membership.objects.filter(organization=organization)
+            .select_related("user")
+            .only(
+                "id",
+                "role",
+                "created_at",
+                "user__id",
+                "user__clerk_id",
+                "user__email",
+                "user__name",
+                "user__avatar_url",
+                "user__created_at",
+            )
+            .order_by("created_at")
+        )
+        page = self.paginate_queryset(memberships)
+        response = self.get_paginated_response(MembershipSerializer(page, many=True).data)
+        payload = ORJSONRenderer().render(response.data)
+        cache.set(cache_key, payload, MEMBERS_CACHE_TTL)
+        return HttpResponse(payload, content_type="application/json")
 
 
 class MembershipViewSet(viewsets.ReadOnlyModelViewSet):
@@ -125,7 +169,16 @@ class APIKeyViewSet(OrganizationRequiredMixin, viewsets.ModelViewSet):
     @action(detail=True, methods=["post"])
     def revoke(self, request, pk=None):
         """Revoke an API key."""
-        api_key = self.get_object()
-        api_key.revoked_at = timezone.now()
-        api_key.save(update_fields=["revoked_at"])
+        organization = get_request_organization(request)
+        # Any key of the organization, so revoking an already-revoked key
+        # succeeds rather than 404ing
+        api_key = get_object_or_404(
+            APIKey.objects.filter(organization=organization).only("id", "key_hash"),
+            pk=pk,
+        )
+
+        APIKey.objects.filter(pk=api_key.pk, revoked_at__isnull=True).update(revoked_at=Now())
+        # update() skips the post_save receiver, so drop the cached verification here
+        key_hash = bytes(api_key.key_hash)
+        transaction.on_commit(lambda: APIKey.invalidate_cache(key_hash))
         return Response({"status": "revoked"})
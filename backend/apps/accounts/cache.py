@@ -0,0 +1,114 @@
+"""Cached lookups for account models used on every authenticated request."""
+
+from typing import Optional
+
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.accounts.models import Organization, User
+
+ORGANIZATION_CACHE_TTL = 60
+USER_CACHE_TTL = 300
+MEMBERS_CACHE_TTL = 300
+
+
+def organization_cache_key(clerk_org_id: str) -> str:
+    return f"org:{clerk_org_id}"
+
+
+def user_cache_key(clerk_id: str) -> str:
+    return f"user:{clerk_id}"
+
+
+def _members_version_key(organization_id: int) -> str:
+    return f"org:{organization_id}:members:version"
+
+
+def members_cache_key(organization_id: int, query_string: str = "") -> str:
+    version = cache.get(_members_version_key(organization_id), 0)
+    return f"org:{organization_id}:members:{version}:{query_string}"
+
+
+def get_cached_organization(clerk_org_id: str) -> Optional[Organization]:
+    """
+    Return the organization for a Clerk org ID, reading through the cache.
+
+    Misses are not cached so an organization synced by webhook becomes
+    visible on the next request.
+    """
+    key = organization_cache_key(clerk_org_id)
+    organization = cache.get(key)
+    if organization is not None:
+        return organization
+
+    try:
+        organization = Organization.objects.get(clerk_org_id=clerk_org_id)
+    except Organization.DoesNotExist:
+        return None
+
+    cache.set(key, organization, ORGANIZATION_CACHE_TTL)
+    return organization
+
+
+def get_organization_id(clerk_org_id: str) -> Optional[int]:
+    """Return the primary key of the organization with this Clerk org ID."""
+    organization = get_cached_organization(clerk_org_id)
+    return organization.id if organization else None
+
+
+def invalidate_organization_cache(clerk_org_id: Optional[str]) -> None:
+    """
+    Drop the cached organization after it has been modified.
+
+    Deferred until commit so a concurrent request can't re-cache the old row
+    while the write transaction is still open.
+    """
+    if clerk_org_id:
+        key = organization_cache_key(clerk_org_id)
+        transaction.on_commit(lambda: cache.delete(key))
+
+
+def get_cached_user(clerk_id: str) -> Optional[User]:
+    """
+    Return the user for a Clerk user ID, reading through the cache.
+
+    Misses are not cached; authentication creates the user on a miss.
+    """
+    key = user_cache_key(clerk_id)
+    user = cache.get(key)
+    if user is not None:
+        return user
+
+    try:
+        user = User.objects.get(clerk_id=clerk_id)
+    except User.DoesNotExist:
+        return None
+
+    cache.set(key, user, USER_CACHE_TTL)
+    return user
+
+
+def get_user_id(clerk_id: str) -> Optional[int]:
+    """Return the primary key of the user with this Clerk user ID."""
+    user = get_cached_user(clerk_id)
+    return user.id if user else None
+
+
+def invalidate_user_cache(clerk_id: Optional[str]) -> None:
+    """Drop the cached user after it has been modified, once committed."""
+    if clerk_id:
+        key = user_cache_key(clerk_id)
+        transaction.on_commit(lambda: cache.delete(key))
+
+
+def invalidate_members_cache(organization_id: int) -> None:
+    """Drop every cached page of an organization's member list by bumping its version."""
+    key = _members_version_key(organization_id)
+
+    def bump():
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
+
+    transaction.on_commit(bump)
@@ -1,104 +1,219 @@
 """Management command to sync users and organizations from Clerk."""
 
+import asyncio
+
 import httpx
 from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
+from apps.accounts.cache import (
+    invalidate_members_cache,
+    invalidate_organization_cache,
+    invalidate_user_cache,
+)
 from apps.accounts.models import User, Organization, Membership
 
+CLERK_API_URL = "https://api.clerk.com/v1"
+PAGE_SIZE = 500
+MAX_CONCURRENT_REQUESTS = 16
+OUTPUT_CHUNK_SIZE = 100
+
+
+def _extract_items(response_json):
+    """Handle both list and dict with "data" key."""
+    if isinstance(response_json, dict):
+        return response_json.get("data", response_json)
+    return response_json
+
+
+async def _fetch_all(client: httpx.AsyncClient, path: str) -> list:
+    """Fetch every page of a Clerk list endpoint."""
+    items = []
+    offset = 0
+    while True:
+        resp = await client.get(path, params={"limit": PAGE_SIZE, "offset": offset})
+        resp.raise_for_status()
+        page = _extract_items(resp.json())
+        items.extend(page)
+        if len(page) < PAGE_SIZE:
+            return items
+        offset += PAGE_SIZE
+
+
+def _client(secret_key: str) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=CLERK_API_URL,
+        headers={"Authorization": f"Bearer {secret_key}"},
+        timeout=30,
+        limits=httpx.Limits(max_connections=32),
+    )
+
 
 class Command(BaseCommand):
     help = "Sync users and organizations from Clerk"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--quiet",
+            action="store_true",
+            help="Skip per-entity output and only print summaries",
+        )
+
     def handle(self, *args, **options):
+        quiet = options["quiet"]
         secret_key = settings.CLERK_SECRET_KEY
         if not secret_key:
             self.stderr.write("CLERK_SECRET_KEY not configured")
             return
 
-        headers = {"Authorization": f"Bearer {secret_key}"}
-        base_url = "https://api.clerk.com/v1"
+        orgs, users = asyncio.run(self._fetch_orgs_and_users(secret_key))
 
         # Sync organizations
         self.stdout.write("Syncing organizations...")
-        try:
-            resp = httpx.get(f"{base_url}/organizations", headers=headers, timeout=30)
-            resp.raise_for_status()
-            orgs_response = resp.json()
-            # Handle both list and dict with "data" key
-            orgs = orgs_response.get("data", orgs_response) if isinstance(orgs_response, dict) else orgs_response
-
-            for org_data in orgs:
-                org, created = Organization.objects.update_or_create(
-                    clerk_org_id=org_data["id"],
-                    defaults={
-                        "name": org_data.get("name", ""),
-                        "slug": org_data.get("slug", org_data["id"]),
-                    },
+        if isinstance(orgs, Exception):
+            self.stderr.write(f"Failed to sync organizations: {orgs}")
+        else:
+            try:
+                synced = Organization.objects.bulk_create(
+                    [
+                        Organization(
+                            clerk_org_id=org_data["id"],
+                            name=org_data.get("name", ""),
+                            slug=org_data.get("slug", org_data["id"]),
+                        )
+                        for org_data in orgs
+                    ],
+                    update_conflicts=True,
+                    unique_fields=["clerk_org_id"],
+                    update_fields=["name", "slug"],
                 )
-                action = "Created" if created else "Updated"
-                self.stdout.write(f"  {action} org: {org.name} ({org.clerk_org_id})")
-        except Exception as e:
-            self.stderr.write(f"Failed to sync organizations: {e}")
+                for org in synced:
+                    invalidate_organization_cache(org.clerk_org_id)
+                self.stdout.write(f"  Synced {len(synced)} organizations")
+            except Exception as e:
+                self.stderr.write(f"Failed to sync organizations: {e}")
 
         # Sync users
         self.stdout.write("Syncing users...")
-        try:
-            resp = httpx.get(f"{base_url}/users", headers=headers, timeout=30)
-            resp.raise_for_status()
-            users_response = resp.json()
-            # Handle both list and dict with "data" key
-            users = users_response.get("data", users_response) if isinstance(users_response, dict) else users_response
-
-            for user_data in users:
-                emails = user_data.get("email_addresses", [])
-                email = emails[0]["email_address"] if emails else f"{user_data['id']}@clerk.temp"
-                first_name = user_data.get("first_name") or ""
-                last_name = user_data.get("last_name") or ""
-                name = f"{first_name} {last_name}".strip()
-
-                user, created = User.objects.update_or_create(
-                    clerk_id=user_data["id"],
-                    defaults={
-                        "email": email,
-                        "name": name,
-                        "avatar_url": user_data.get("image_url", ""),
-                    },
+        if isinstance(users, Exception):
+            self.stderr.write(f"Failed to sync users: {users}")
+        else:
+            try:
+                synced = User.objects.bulk_create(
+                    [self._build_user(user_data) for user_data in users],
+                    update_conflicts=True,
+                    unique_fields=["clerk_id"],
+                    update_fields=["email", "name", "avatar_url", "updated_at"],
                 )
-                action = "Created" if created else "Updated"
-                self.stdout.write(f"  {action} user: {user.email}")
-        except Exception as e:
-            self.stderr.write(f"Failed to sync users: {e}")
+                for user in synced:
+                    invalidate_user_cache(user.clerk_id)
+                self.stdout.write(f"  Synced {len(synced)} users")
+            except Exception as e:
+                self.stderr.write(f"Failed to sync users: {e}")
 
         # Sync memberships
         self.stdout.write("Syncing memberships...")
-        for org in Organization.objects.filter(clerk_org_id__isnull=False):
-            try:
-                resp = httpx.get(
-                    f"{base_url}/organizations/{org.clerk_org_id}/memberships",
-                    headers=headers,
-                    timeout=30,
+        synced_orgs = list(Organization.objects.filter(clerk_org_id__isnull=False))
+        results = asyncio.run(self._fetch_memberships(secret_key, synced_orgs))
+
+        clerk_user_ids = {
+            mem_data.get("public_user_data", {}).get("user_id")
+            for memberships in results
+            if not isinstance(memberships, Exception)
+            for mem_data in memberships
+        }
+        users_by_clerk_id = User.objects.in_bulk(
+            [user_id for user_id in clerk_user_ids if user_id],
+            field_name="clerk_id",
+        )
+
+        membership_objs = []
+        missing_lines = []
+        for org, memberships in zip(synced_orgs, results):
+            if isinstance(memberships, Exception):
+                self.stderr.write(f"Failed to sync memberships for {org.name}: {memberships}")
+                continue
+
+            for mem_data in memberships:
+                user_id = mem_data.get("public_user_data", {}).get("user_id")
+                role = mem_data.get("role", "member")
+
+                user = users_by_clerk_id.get(user_id)
+                if not user:
+                    if not quiet:
+                        missing_lines.append(f"  User not found: {user_id}")
+                        if len(missing_lines) >= OUTPUT_CHUNK_SIZE:
+                            self._flush(self.stderr, missing_lines)
+                    continue
+
+                membership_objs.append(
+                    Membership(
+                        user=user,
+                        organization=org,
+                        role="admin" if role == "admin" else "member",
+                    )
                 )
-                resp.raise_for_status()
-                mem_response = resp.json()
-                memberships = mem_response.get("data", mem_response) if isinstance(mem_response, dict) else mem_response
-
-                for mem_data in memberships:
-                    user_id = mem_data.get("public_user_data", {}).get("user_id")
-                    role = mem_data.get("role", "member")
-
-                    try:
-                        user = User.objects.get(clerk_id=user_id)
-                        membership, created = Membership.objects.update_or_create(
-                            user=user,
-                            organization=org,
-                            defaults={"role": "admin" if role == "admin" else "member"},
-                        )
-                        action = "Created" if created else "Updated"
-                        self.stdout.write(f"  {action} membership: {user.email} -> {org.name}")
-                    except User.DoesNotExist:
-                        self.stderr.write(f"  User not found: {user_id}")
-            except Exception as e:
-                self.stderr.write(f"Failed to sync memberships for {org.name}: {e}")
+
+        self._flush(self.stderr, missing_lines)
+
+        try:
+            with transaction.atomic():
+                synced = Membership.objects.bulk_create(
+                    membership_objs,
+                    update_conflicts=True,
+                    unique_fields=["user", "organization"],
+                    update_fields=["role", "updated_at"],
+                )
+                # bulk_create bypasses the post_save handlers
+                for org in synced_orgs:
+                    invalidate_members_cache(org.id)
+            self.stdout.write(f"  Synced {len(synced)} memberships")
+        except Exception as e:
+            self.stderr.write(f"Failed to sync memberships: {e}")
 
         self.stdout.write(self.style.SUCCESS("Sync complete!"))
+
+    @staticmethod
+    def _flush(stream, lines: list) -> None:
+        """Write buffered lines in a single call and clear the buffer."""
+        if lines:
+            stream.write("\n".join(lines))
+            lines.clear()
+
+    @staticmethod
+    def _build_user(user_data: dict) -> User:
+        emails = user_data.get("email_addresses", [])
+        email = emails[0]["email_address"] if emails else f"{user_data['id']}@clerk.temp"
+        first_name = user_data.get("first_name") or ""
+        last_name = user_data.get("last_name") or ""
+        return User(
+            clerk_id=user_data["id"],
+            email=email,
+            name=f"{first_name} {last_name}".strip(),
+            avatar_url=user_data.get("image_url", ""),
+        )
+
+    async def _fetch_orgs_and_users(self, secret_key: str):
+        """Fetch all organizations and users concurrently."""
+        async with _client(secret_key) as client:
+            return await asyncio.gather(
+                _fetch_all(client, "/organizations"),
+                _fetch_all(client, "/users"),
+                return_exceptions=True,
+            )
+
+    async def _fetch_memberships(self, secret_key: str, orgs: list) -> list:
+        """Fetch memberships for every organization, bounded by a semaphore."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async with _client(secret_key) as client:
+
+            async def fetch(org):
+                async with semaphore:
+                    return await _fetch_all(client, f"/organizations/{org.clerk_org_id}/memberships")
+
+            return await asyncio.gather(
+                *[fetch(org) for org in orgs],
+                return_exceptions=True,
+            )
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.8 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_remove_apikey_accounts_ap_organiz_18cc7e_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="apikey",
+            name="key_hash",
+            field=models.CharField(max_length=64, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="organization",
+            name="clerk_org_id",
+            field=models.CharField(blank=True, max_length=255, null=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="user",
+            name="clerk_id",
+            field=models.CharField(max_length=255, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="user",
+            name="email",
+            field=models.EmailField(max_length=255, unique=True),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.8 on 2026-10-16 09:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_alter_apikey_key_hash_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="apikey",
+            index=models.Index(
+                condition=models.Q(("revoked_at__isnull", True)),
+                fields=["key_hash"],
+                name="apikey_active_hash",
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.8 on 2026-10-16 09:41
+
+from django.db import migrations, models
+
+
+def hex_to_digest(apps, schema_editor):
+    APIKey = apps.get_model("accounts", "APIKey")
+    for api_key in APIKey.objects.only("id", "key_hash").iterator():
+        APIKey.objects.filter(pk=api_key.pk).update(
+            key_hash_digest=bytes.fromhex(api_key.key_hash)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_apikey_apikey_active_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="apikey",
+            name="key_hash_digest",
+            field=models.BinaryField(max_length=32, null=True),
+        ),
+        migrations.RunPython(hex_to_digest, migrations.RunPython.noop),
+    ]
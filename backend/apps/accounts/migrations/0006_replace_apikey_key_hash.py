@@ -0,0 +1,39 @@
+# Generated by Django 5.1.8 on 2026-10-16 09:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_apikey_key_hash_digest"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="apikey",
+            name="apikey_active_hash",
+        ),
+        migrations.RemoveField(
+            model_name="apikey",
+            name="key_hash",
+        ),
+        migrations.RenameField(
+            model_name="apikey",
+            old_name="key_hash_digest",
+            new_name="key_hash",
+        ),
+        migrations.AlterField(
+            model_name="apikey",
+            name="key_hash",
+            field=models.BinaryField(max_length=32, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name="apikey",
+            index=models.Index(
+                condition=models.Q(("revoked_at__isnull", True)),
+                fields=["key_hash"],
+                name="apikey_active_hash",
+            ),
+        ),
+    ]
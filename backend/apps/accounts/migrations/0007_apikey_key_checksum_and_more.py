@@ -0,0 +1,30 @@
+# Generated by Django 5.1.8 on 2026-10-16 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0006_replace_apikey_key_hash"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="apikey",
+            name="apikey_active_hash",
+        ),
+        migrations.AddField(
+            model_name="apikey",
+            name="key_checksum",
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="apikey",
+            index=models.Index(
+                condition=models.Q(("revoked_at__isnull", True)),
+                fields=["key_prefix", "key_checksum"],
+                name="apikey_active_prefix",
+            ),
+        ),
+    ]
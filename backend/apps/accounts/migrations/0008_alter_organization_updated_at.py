@@ -0,0 +1,30 @@
+# Generated by Django 5.1.8 on 2026-10-16 10:20
+
+import django.db.models.functions.datetime
+from django.contrib.postgres.operations import CreateExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0007_apikey_key_checksum_and_more"),
+    ]
+
+    operations = [
+        CreateExtension("moddatetime"),
+        migrations.AlterField(
+            model_name="organization",
+            name="updated_at",
+            field=models.DateTimeField(
+                db_default=django.db.models.functions.datetime.Now(), editable=False
+            ),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE TRIGGER set_updated_at BEFORE UPDATE ON accounts_organization "
+                "FOR EACH ROW EXECUTE FUNCTION moddatetime(updated_at);"
+            ),
+            reverse_sql="DROP TRIGGER IF EXISTS set_updated_at ON accounts_organization;",
+        ),
+    ]
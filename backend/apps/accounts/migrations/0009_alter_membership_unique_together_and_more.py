@@ -0,0 +1,23 @@
+# Generated by Django 5.1.8 on 2026-10-16 11:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_alter_organization_updated_at"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="membership",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="membership",
+            constraint=models.UniqueConstraint(
+                fields=("user", "organization"), name="uniq_membership"
+            ),
+        ),
+    ]
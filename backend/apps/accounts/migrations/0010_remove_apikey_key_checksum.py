@@ -0,0 +1,21 @@
+# Generated by Django 5.1.8 on 2026-10-16 19:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0009_alter_membership_unique_together_and_more"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="apikey",
+            name="apikey_active_prefix",
+        ),
+        migrations.RemoveField(
+            model_name="apikey",
+            name="key_checksum",
+        ),
+    ]
@@ -1,12 +1,20 @@
 """Account models for multi-tenant organization management."""
 
+import base64
 import hashlib
 import secrets
+
+from django.core.cache import cache
 from django.db import models
+from django.db.models.functions import Now
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager
 
 from apps.core.models import TimeStampedModel
 
+API_KEY_CACHE_TTL = 60 * 5
+API_KEY_MISSING_CACHE_TTL = 30
+API_KEY_MISSING = "__missing__"
+
 
 class UserManager(BaseUserManager):
     """Custom user manager for Clerk-based authentication."""
@@ -30,8 +38,8 @@ class User(AbstractBaseUser, TimeStampedModel):
     Users are authenticated via Clerk JWTs, so we don't store passwords.
     """
 
-    clerk_id = models.CharField(max_length=255, unique=True, db_index=True)
-    email = models.EmailField(max_length=255, unique=True, db_index=True)
+    clerk_id = models.CharField(max_length=255, unique=True)
+    email = models.EmailField(max_length=255, unique=True)
     name = models.CharField(max_length=255, blank=True)
     avatar_url = models.URLField(max_length=500, blank=True)
 
@@ -73,10 +81,8 @@ class Organization(TimeStampedModel):
         COMPLETED = "completed", "Completed"
 
     name = models.CharField(max_length=255)
-    slug = models.SlugField(max_length=255, unique=True, db_index=True)
-    clerk_org_id = models.CharField(
-        max_length=255, unique=True, null=True, blank=True, db_index=True
-    )
+    slug = models.SlugField(max_length=255, unique=True)
+    clerk_org_id = models.CharField(max_length=255, unique=True, null=True, blank=True)
 
     settings = models.JSONField(
         default=dict,
@@ -91,6 +97,9 @@ class Organization(TimeStampedModel):
     )
     onboarding_completed_at = models.DateTimeField(null=True, blank=True)
 
+    # Maintained by the set_updated_at trigger (moddatetime) on every UPDATE
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
+
     class Meta:
         verbose_name = "Organization"
         verbose_name_plural = "Organizations"
@@ -142,7 +151,9 @@ class Membership(TimeStampedModel):
     class Meta:
         verbose_name = "Membership"
         verbose_name_plural = "Memberships"
-        unique_together = [("user", "organization")]
+        constraints = [
+            models.UniqueConstraint(fields=["user", "organization"], name="uniq_membership"),
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.organization.name} ({self.role})"
@@ -159,7 +170,7 @@ class APIKey(TimeStampedModel):
         related_name="api_keys",
     )
     name = models.CharField(max_length=255)
-    key_hash = models.CharField(max_length=64, unique=True, db_index=True)
+    key_hash = models.BinaryField(max_length=32, unique=True)
     key_prefix = models.CharField(max_length=8)
     permissions = models.JSONField(default=list)
     last_used_at = models.DateTimeField(null=True, blank=True)
@@ -184,14 +195,13 @@ class APIKey(TimeStampedModel):
 
     @classmethod
     def generate_key(cls):
-        """Generate a new API key."""
-        key = secrets.token_urlsafe(32)
-        return key
+        """Generate a new API key (33 random bytes encode to 44 chars with no padding)."""
+        return base64.urlsafe_b64encode(secrets.token_bytes(33)).decode("ascii")
 
     @classmethod
-    def hash_key(cls, key: str) -> str:
-        """Hash an API key for storage."""
-        return hashlib.sha256(key.encode()).hexdigest()
+    def hash_key(cls, key: str) -> bytes:
+        """Hash an API key for storage as a raw SHA-256 digest."""
+        return hashlib.sha256(key.encode()).digest()
 
     @classmethod
     def create_key(cls, organization, name, created_by, permissions=None):
@@ -212,15 +222,42 @@ class APIKey(TimeStampedModel):
         # Return both the model and the raw key (only shown once)
         return api_key, key
 
+    @staticmethod
+    def cache_key(key_hash: bytes) -> str:
+        return f"apikey:{key_hash.hex()}"
+
+    @classmethod
+    def invalidate_cache(cls, key_hash: bytes):
+        """Drop the cached verification result for a key."""
+        cache.delete(cls.cache_key(key_hash))
+
     @classmethod
     def verify_key(cls, key: str):
-        """Verify an API key and return the associated APIKey object."""
+        """
+        Verify an API key and return the associated APIKey object.
+
+        Results are cached by key hash; unknown keys are cached briefly as
+        well so floods of bad keys don't reach the database.
+        """
         key_hash = cls.hash_key(key)
-        try:
-            api_key = cls.objects.select_related("organization").get(
-                key_hash=key_hash,
-                revoked_at__isnull=True,
-            )
-            return api_key
-        except cls.DoesNotExist:
+        cache_key = cls.cache_key(key_hash)
+
+        cached = cache.get(cache_key)
+        if cached == API_KEY_MISSING:
             return None
+        if cached is not None:
+            return cached
+
+        # key_hash is unique, so this is a single indexed lookup
+        api_key = (
+            cls.objects.select_related("organization")
+            .filter(key_hash=key_hash, revoked_at__isnull=True)
+            .first()
+        )
+
+        if api_key is None:
+            cache.set(cache_key, API_KEY_MISSING, API_KEY_MISSING_CACHE_TTL)
+            return None
+
+        cache.set(cache_key, api_key, API_KEY_CACHE_TTL)
+        return api_key
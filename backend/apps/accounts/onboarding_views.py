@@ -1,19 +1,19 @@
 """Onboarding API views."""
 
+from django.contrib.postgres.aggregates import ArrayAgg, BoolOr
+from django.db.models import BooleanField, Case, Value, When
 from django.utils import timezone
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.accounts.cache import invalidate_organization_cache
+from apps.accounts.models import Organization
 from apps.core.permissions import (
     IsOrganizationMember,
     IsOrganizationAdmin,
     OrganizationRequiredMixin,
 )
-from apps.integrations.models import Integration
-
-
-STORE_PLATFORMS = {"salla", "shopify"}
-ADS_PLATFORMS = {"meta", "google", "tiktok", "snapchat"}
+from apps.integrations.models import Integration, STORE_PLATFORMS, AD_PLATFORMS
 
 
 class OnboardingStatusView(OrganizationRequiredMixin, APIView):
@@ -26,19 +26,26 @@ class OnboardingStatusView(OrganizationRequiredMixin, APIView):
         if error_response:
             return error_response
 
-        integrations = set(
-            Integration.objects.filter(
-                organization=organization,
-                is_connected=True,
-            ).values_list("platform", flat=True)
+        integrations = Integration.objects.filter(
+            organization=organization,
+            is_connected=True,
+        ).aggregate(
+            has_store=BoolOr(
+                Case(When(platform__in=STORE_PLATFORMS, then=Value(True)), default=Value(False), output_field=BooleanField())
+            ),
+            has_ads=BoolOr(
+                Case(When(platform__in=AD_PLATFORMS, then=Value(True)), default=Value(False), output_field=BooleanField())
+            ),
+            platforms=ArrayAgg("platform", distinct=True),
         )
 
         return Response({
             "status": organization.onboarding_status,
             "completed_at": organization.onboarding_completed_at,
-            "has_store_connected": bool(integrations & STORE_PLATFORMS),
-            "has_ads_connected": bool(integrations & ADS_PLATFORMS),
-            "connected_integrations": list(integrations),
+            # BoolOr over zero rows is NULL
+            "has_store_connected": bool(integrations["has_store"]),
+            "has_ads_connected": bool(integrations["has_ads"]),
+            "connected_integrations": integrations["platforms"] or [],
         })
 
 
@@ -52,11 +59,14 @@ class CompleteOnboardingView(OrganizationRequiredMixin, APIView):
         if error_response:
             return error_response
 
-        organization.onboarding_status = "completed"
-        organization.onboarding_completed_at = timezone.now()
-        organization.save(update_fields=["onboarding_status", "onboarding_completed_at", "updated_at"])
+        completed_at = timezone.now()
+        Organization.objects.filter(pk=organization.pk).update(
+            onboarding_status=Organization.OnboardingStatus.COMPLETED,
+            onboarding_completed_at=completed_at,
+        )
+        invalidate_organization_cache(organization.clerk_org_id)
 
         return Response({
             "status": "completed",
-            "completed_at": organization.onboarding_completed_at,
+            "completed_at": completed_at,
         })
@@ -0,0 +1,39 @@
+"""Signal handlers keeping cached account payloads fresh."""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.accounts.cache import invalidate_members_cache, invalidate_user_cache
+from apps.accounts.models import APIKey, Membership, User
+
+
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def invalidate_membership_members_cache(sender, instance, **kwargs):
+    invalidate_members_cache(instance.organization_id)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_members_cache(sender, instance, created, **kwargs):
+    if created:
+        return
+    organization_ids = Membership.objects.filter(user=instance).values_list(
+        "organization_id", flat=True
+    )
+    for organization_id in organization_ids:
+        invalidate_members_cache(organization_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    invalidate_user_cache(instance.clerk_id)
+
+
+@receiver(post_save, sender=APIKey)
+@receiver(post_delete, sender=APIKey)
+def invalidate_cached_api_key(sender, instance, **kwargs):
+    # Deferred so a concurrent verify can't re-cache the row before commit
+    key_hash = bytes(instance.key_hash)
+    transaction.on_commit(lambda: APIKey.invalidate_cache(key_hash))
@@ -0,0 +1,148 @@
+"""Celery tasks for applying Clerk webhook events."""
+
+import logging
+
+from celery import shared_task
+
+from .cache import (
+    get_organization_id,
+    get_user_id,
+    invalidate_members_cache,
+    invalidate_organization_cache,
+    invalidate_user_cache,
+)
+from .models import User, Organization, Membership
+
+logger = logging.getLogger(__name__)
+
+
+def extract_user_info(data: dict) -> dict:
+    """Extract user information from Clerk webhook data."""
+    first_name = data.get("first_name") or ""
+    last_name = data.get("last_name") or ""
+    emails = data.get("email_addresses")
+    return {
+        "clerk_id": data.get("id"),
+        "email": emails[0].get("email_address", "") if emails else "",
+        "name": (first_name + " " + last_name).strip() if first_name or last_name else "",
+        "avatar_url": data.get("image_url", ""),
+    }
+
+
+def _handle_user_upsert(data):
+    """Handle user.created and user.updated events."""
+    user_info = extract_user_info(data)
+    clerk_id = user_info.pop("clerk_id")
+
+    User.objects.update_or_create(clerk_id=clerk_id, defaults=user_info)
+    invalidate_user_cache(clerk_id)
+    logger.info(f"Created/updated user: {user_info['email']}")
+
+
+def _handle_user_deleted(data):
+    """Handle user.deleted event."""
+    clerk_id = data.get("id")
+    User.objects.filter(clerk_id=clerk_id).update(is_active=False)
+    invalidate_user_cache(clerk_id)
+    logger.info(f"Deactivated user: {clerk_id}")
+
+
+def _handle_org_upsert(data):
+    """Handle organization.created and organization.updated events."""
+    clerk_org_id = data.get("id")
+    name = data.get("name", "")
+    slug = data.get("slug", "")
+
+    Organization.objects.update_or_create(
+        clerk_org_id=clerk_org_id,
+        defaults={"name": name, "slug": slug},
+    )
+    invalidate_organization_cache(clerk_org_id)
+    logger.info(f"Created/updated organization: {name}")
+
+
+def _handle_org_deleted(data):
+    """Handle organization.deleted event."""
+    clerk_org_id = data.get("id")
+    Organization.objects.filter(clerk_org_id=clerk_org_id).update(clerk_org_id=None)
+    invalidate_organization_cache(clerk_org_id)
+    logger.info(f"Deleted organization: {clerk_org_id}")
+
+
+def _handle_membership_upsert(data):
+    """Handle organizationMembership.created and updated events."""
+    org_data = data.get("organization", {})
+    user_data = data.get("public_user_data", {})
+    role = data.get("role", "member")
+    clerk_org_id = org_data.get("id")
+    clerk_user_id = user_data.get("user_id")
+
+    organization_id = get_organization_id(clerk_org_id) if clerk_org_id else None
+    user_id = get_user_id(clerk_user_id) if clerk_user_id else None
+    if organization_id is None or user_id is None:
+        logger.warning(f"Could not create membership: {clerk_user_id} -> {clerk_org_id} not found")
+        return
+
+    Membership.objects.bulk_create(
+        [
+            Membership(
+                user_id=user_id,
+                organization_id=organization_id,
+                role="admin" if role == "admin" else "member",
+            )
+        ],
+        update_conflicts=True,
+        unique_fields=["user", "organization"],
+        update_fields=["role", "updated_at"],
+    )
+    # bulk_create bypasses the post_save handlers
+    invalidate_members_cache(organization_id)
+    logger.info(f"Created/updated membership: {clerk_user_id} -> {clerk_org_id}")
+
+
+def _handle_membership_deleted(data):
+    """Handle organizationMembership.deleted event."""
+    org_data = data.get("organization", {})
+    user_data = data.get("public_user_data", {})
+    clerk_org_id = org_data.get("id")
+    clerk_user_id = user_data.get("user_id")
+
+    organization_id = get_organization_id(clerk_org_id) if clerk_org_id else None
+    user_id = get_user_id(clerk_user_id) if clerk_user_id else None
+
+    deleted = 0
+    if organization_id is not None and user_id is not None:
+        deleted, _ = Membership.objects.filter(user_id=user_id, organization_id=organization_id).delete()
+    if deleted:
+        logger.info(f"Deleted membership: {clerk_user_id} -> {clerk_org_id}")
+    else:
+        logger.warning(f"Could not delete membership: {clerk_user_id} -> {clerk_org_id} not found")
+
+
+# Map event types to handlers (updated events use same handler as created)
+EVENT_HANDLERS = {
+    "user.created": _handle_user_upsert,
+    "user.updated": _handle_user_upsert,
+    "user.deleted": _handle_user_deleted,
+    "organization.created": _handle_org_upsert,
+    "organization.updated": _handle_org_upsert,
+    "organization.deleted": _handle_org_deleted,
+    "organizationMembership.created": _handle_membership_upsert,
+    "organizationMembership.updated": _handle_membership_upsert,
+    "organizationMembership.deleted": _handle_membership_deleted,
+}
+
+
+@shared_task(bind=True, acks_late=True, max_retries=3)
+def process_clerk_event(self, event_type: str, data: dict):
+    """Apply a Clerk webhook event queued by ClerkWebhookView."""
+    handler = EVENT_HANDLERS.get(event_type)
+    if handler is None:
+        logger.warning(f"Unhandled Clerk webhook type: {event_type}")
+        return
+
+    try:
+        handler(data)
+    except Exception as e:
+        logger.error(f"Error processing Clerk webhook {event_type}: {e}")
+        raise self.retry(exc=e, countdown=30)
@@ -0,0 +1,57 @@
+"""Tests for API key verification and revocation."""
+
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.accounts.api.views import APIKeyViewSet
+from apps.accounts.models import APIKey, Membership, Organization, User
+
+
+class APIKeyVerifyTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(name="Acme", slug="acme", clerk_org_id="org_acme")
+        cls.user = User.objects.create_user(clerk_id="user_admin", email="admin@acme.test")
+        Membership.objects.create(user=cls.user, organization=cls.organization, role=Membership.Role.ADMIN)
+
+    def setUp(self):
+        self.api_key, self.raw_key = APIKey.create_key(self.organization, "Pixel", self.user)
+
+    def revoke(self, pk):
+        request = APIRequestFactory().post(f"/api/v1/api-keys/{pk}/revoke/")
+        request.organization = self.organization
+        force_authenticate(request, user=self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            return APIKeyViewSet.as_view({"post": "revoke"})(request, pk=pk)
+
+    def test_verify_returns_active_key(self):
+        verified = APIKey.verify_key(self.raw_key)
+        self.assertEqual(verified.pk, self.api_key.pk)
+        self.assertEqual(verified.organization_id, self.organization.id)
+
+    def test_verify_unknown_key(self):
+        self.assertIsNone(APIKey.verify_key(APIKey.generate_key()))
+
+    def test_verify_after_revoke(self):
+        # Prime the cache so the revoke has to invalidate it
+        self.assertIsNotNone(APIKey.verify_key(self.raw_key))
+
+        response = self.revoke(self.api_key.pk)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(APIKey.verify_key(self.raw_key))
+
+    def test_revoke_is_idempotent(self):
+        self.revoke(self.api_key.pk)
+        response = self.revoke(self.api_key.pk)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(APIKey.verify_key(self.raw_key))
+
+    def test_verify_after_delete(self):
+        self.assertIsNotNone(APIKey.verify_key(self.raw_key))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.api_key.delete()
+
+        self.assertIsNone(APIKey.verify_key(self.raw_key))
@@ -1,140 +1,112 @@
-"""Clerk webhook handlers for user and organization sync."""
+"""Clerk webhook endpoint for user and organization sync."""
 
+import base64
+import hashlib
+import hmac
 import logging
+import time
 
+from django.conf import settings
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import User, Organization, Membership
+from .tasks import EVENT_HANDLERS, process_clerk_event
 
 logger = logging.getLogger(__name__)
 
-
-def extract_user_info(data: dict) -> dict:
-    """Extract user information from Clerk webhook data."""
-    first_name = data.get("first_name", "")
-    last_name = data.get("last_name", "")
-    return {
-        "clerk_id": data.get("id"),
-        "email": data.get("email_addresses", [{}])[0].get("email_address", ""),
-        "name": f"{first_name} {last_name}".strip(),
-        "avatar_url": data.get("image_url", ""),
-    }
+# Reject deliveries whose svix-timestamp is further than this from now
+WEBHOOK_TOLERANCE_SECONDS = 5 * 60
+# How long a delivered svix message id is remembered, covering Clerk's retries
+WEBHOOK_REPLAY_TTL = 15 * 60
 
 
 class ClerkWebhookView(APIView):
     """
-    Handle Clerk webhooks for user and organization sync.
+    Receive Clerk webhooks for user and organization sync.
 
     Clerk sends webhooks for:
     - user.created, user.updated, user.deleted
     - organization.created, organization.updated, organization.deleted
     - organizationMembership.created, organizationMembership.updated, organizationMembership.deleted
+
+    Events are queued to process_clerk_event on CLERK_WEBHOOK_QUEUE so the
+    response doesn't wait on database writes.
     """
 
     permission_classes = [AllowAny]
 
-    # Map event types to handlers (updated events use same handler as created)
-    EVENT_HANDLERS = {
-        "user.created": "_handle_user_upsert",
-        "user.updated": "_handle_user_upsert",
-        "user.deleted": "_handle_user_deleted",
-        "organization.created": "_handle_org_upsert",
-        "organization.updated": "_handle_org_upsert",
-        "organization.deleted": "_handle_org_deleted",
-        "organizationMembership.created": "_handle_membership_upsert",
-        "organizationMembership.updated": "_handle_membership_upsert",
-        "organizationMembership.deleted": "_handle_membership_deleted",
-    }
-
     def post(self, request):
-        """Process Clerk webhook."""
-        # TODO: Verify webhook signature using svix
+        """Queue Clerk webhook for processing."""
+        if not self.verify_webhook(request):
+            return Response({"error": "Invalid signature"}, status=status.HTTP_401_UNAUTHORIZED)
+
+        # SET NX on the message id; add() returns None (not False) if Redis is
+        # unavailable, in which case the event is processed rather than dropped.
+        replay_key = None
+        svix_id = request.headers.get("svix-id")
+        if svix_id:
+            replay_key = f"clerk:evt:{svix_id}"
+            if cache.add(replay_key, 1, WEBHOOK_REPLAY_TTL) is False:
+                return Response({"status": "duplicate"})
+
         try:
             event_type = request.data.get("type")
             data = request.data.get("data", {})
 
             logger.info(f"Received Clerk webhook: {event_type}")
 
-            handler_name = self.EVENT_HANDLERS.get(event_type)
-            if handler_name:
-                handler = getattr(self, handler_name)
-                handler(data)
-                return Response({"status": "processed"})
+            if event_type not in EVENT_HANDLERS:
+                logger.warning(f"Unhandled Clerk webhook type: {event_type}")
+                return Response({"status": "ignored"})
 
-            logger.warning(f"Unhandled Clerk webhook type: {event_type}")
-            return Response({"status": "ignored"})
+            process_clerk_event.apply_async(
+                (event_type, data),
+                queue=settings.CLERK_WEBHOOK_QUEUE,
+            )
+            return Response({"status": "queued"})
 
         except Exception as e:
-            logger.error(f"Error processing Clerk webhook: {e}")
+            logger.error(f"Error queueing Clerk webhook: {e}")
+            if replay_key:
+                # Let Clerk's retry through since this delivery wasn't queued
+                cache.delete(replay_key)
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-    def _handle_user_upsert(self, data):
-        """Handle user.created and user.updated events."""
-        user_info = extract_user_info(data)
-        clerk_id = user_info.pop("clerk_id")
-
-        User.objects.update_or_create(clerk_id=clerk_id, defaults=user_info)
-        logger.info(f"Created/updated user: {user_info['email']}")
-
-    def _handle_user_deleted(self, data):
-        """Handle user.deleted event."""
-        clerk_id = data.get("id")
-        User.objects.filter(clerk_id=clerk_id).update(is_active=False)
-        logger.info(f"Deactivated user: {clerk_id}")
-
-    def _handle_org_upsert(self, data):
-        """Handle organization.created and organization.updated events."""
-        clerk_org_id = data.get("id")
-        name = data.get("name", "")
-        slug = data.get("slug", "")
-
-        Organization.objects.update_or_create(
-            clerk_org_id=clerk_org_id,
-            defaults={"name": name, "slug": slug},
-        )
-        logger.info(f"Created/updated organization: {name}")
-
-    def _handle_org_deleted(self, data):
-        """Handle organization.deleted event."""
-        clerk_org_id = data.get("id")
-        Organization.objects.filter(clerk_org_id=clerk_org_id).update(clerk_org_id=None)
-        logger.info(f"Deleted organization: {clerk_org_id}")
-
-    def _handle_membership_upsert(self, data):
-        """Handle organizationMembership.created and updated events."""
-        org_data = data.get("organization", {})
-        user_data = data.get("public_user_data", {})
-        role = data.get("role", "member")
+    def verify_webhook(self, request) -> bool:
+        """Verify the svix signature Clerk attaches to each delivery."""
+        secret = getattr(settings, "CLERK_WEBHOOK_SECRET", "")
+        if not secret:
+            # Unsigned deliveries are only accepted in local development
+            if not settings.DEBUG:
+                logger.error("CLERK_WEBHOOK_SECRET is not set; rejecting webhook")
+            return settings.DEBUG
+
+        svix_id = request.headers.get("svix-id", "")
+        svix_timestamp = request.headers.get("svix-timestamp", "")
+        svix_signature = request.headers.get("svix-signature", "")
+        if not (svix_id and svix_timestamp and svix_signature):
+            return False
 
         try:
-            organization = Organization.objects.get(clerk_org_id=org_data.get("id"))
-            user = User.objects.get(clerk_id=user_data.get("user_id"))
-
-            Membership.objects.update_or_create(
-                user=user,
-                organization=organization,
-                defaults={"role": "admin" if role == "admin" else "member"},
-            )
-            logger.info(f"Created/updated membership: {user.email} -> {organization.name}")
-        except (Organization.DoesNotExist, User.DoesNotExist) as e:
-            logger.warning(f"Could not create membership: {e}")
-
-    def _handle_membership_deleted(self, data):
-        """Handle organizationMembership.deleted event."""
-        org_data = data.get("organization", {})
-        user_data = data.get("public_user_data", {})
-
-        try:
-            organization = Organization.objects.get(clerk_org_id=org_data.get("id"))
-            user = User.objects.get(clerk_id=user_data.get("user_id"))
-
-            Membership.objects.filter(user=user, organization=organization).delete()
-            logger.info(f"Deleted membership: {user.email} -> {organization.name}")
-        except (Organization.DoesNotExist, User.DoesNotExist) as e:
-            logger.warning(f"Could not delete membership: {e}")
+            timestamp = int(svix_timestamp)
+        except ValueError:
+            return False
+        if abs(time.time() - timestamp) > WEBHOOK_TOLERANCE_SECONDS:
+            return False
+
+        key = base64.b64decode(secret.removeprefix("whsec_"))
+        signed_content = f"{svix_id}.{svix_timestamp}.".encode() + request.body
+        expected = base64.b64encode(hmac.new(key, signed_content, hashlib.sha256).digest())
+
+        # Header holds space-separated "v1,<base64>" entries (one per active secret)
+        for entry in svix_signature.split():
+            version, _, signature = entry.partition(",")
+            if version == "v1" and hmac.compare_digest(expected, signature.encode()):
+                return True
+        return False
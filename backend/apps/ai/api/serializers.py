@@ -6,10 +6,21 @@ from apps.ai.models import ChatMessage, ChatThread
 
 
 class ChatMessageSerializer(serializers.ModelSerializer):
+    citations = serializers.SerializerMethodField()
+
     class Meta:
         model = ChatMessage
         fields = ["id", "role", "content", "citations", "created_at"]
 
+    def get_citations(self, obj) -> list:
+        """Expand pooled citation ids; legacy rows already hold the dicts."""
+        pool = self.context.get("citation_pool", {})
+        return [
+            pool[citation] if isinstance(citation, int) else citation
+            for citation in obj.citations
+            if not isinstance(citation, int) or citation in pool
+        ]
+
 
 class ChatThreadSerializer(serializers.ModelSerializer):
     messages = ChatMessageSerializer(many=True, read_only=True)
@@ -24,3 +35,9 @@ class ChatThreadSerializer(serializers.ModelSerializer):
             "created_at",
             "messages",
         ]
+
+    def to_representation(self, instance):
+        self.context["citation_pool"] = {
+            citation.id: citation.as_dict() for citation in instance.citations.all()
+        }
+        return super().to_representation(instance)
@@ -1,26 +1,35 @@
 """API views for AI chat."""
 
+import json
 from datetime import date
+from functools import lru_cache
 
-from django.utils import timezone
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.core.permissions import OrganizationRequiredMixin, IsOrganizationMember, get_request_organization
 from apps.ai.models import ChatThread, ChatMessage
 from apps.ai.api.serializers import ChatThreadSerializer
-from apps.ai.services.chat import generate_chat_response
+from apps.ai.services.chat import generate_chat_response, stream_chat_response
 
 
+@lru_cache(maxsize=4096)
 def _parse_date(value: str | None) -> date | None:
     if not value:
         return None
     try:
-        return timezone.datetime.strptime(value, "%Y-%m-%d").date()
+        return date.fromisoformat(value)
     except ValueError:
         return None
 
 
+def _sse(event: dict) -> str:
+    return f"data: {json.dumps(event, cls=DjangoJSONEncoder)}\n\n"
+
+
 class ChatView(OrganizationRequiredMixin, APIView):
     permission_classes = [IsOrganizationMember]
 
@@ -33,6 +42,27 @@ class ChatView(OrganizationRequiredMixin, APIView):
         if not message:
             return Response({"detail": "Message is required"}, status=400)
 
+        thread, start_date, end_date = self.start_turn(request, organization, message)
+
+        payload = generate_chat_response(
+            organization_id=organization.id,
+            thread=thread,
+            message=message,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        return Response(
+            {
+                "thread_id": thread.id,
+                "assistant_message": payload["answer"],
+                "citations": payload["citations"],
+                "follow_ups": payload["follow_ups"],
+            }
+        )
+
+    def start_turn(self, request, organization, message: str) -> tuple[ChatThread, date | None, date | None]:
+        """Resolve or create the thread and record the user's message."""
         thread_id = request.data.get("thread_id")
         date_range = request.data.get("date_range") or {}
         start_date = _parse_date(date_range.get("start_date"))
@@ -57,8 +87,24 @@ class ChatView(OrganizationRequiredMixin, APIView):
             role=ChatMessage.Role.USER,
             content=message,
         )
+        return thread, start_date, end_date
 
-        payload = generate_chat_response(
+
+class ChatStreamView(ChatView):
+    """Same request as ChatView, answered as server-sent events while the model generates."""
+
+    def post(self, request):
+        organization = get_request_organization(request)
+        if not organization:
+            return Response({"detail": "Organization required"}, status=400)
+
+        message = request.data.get("message", "").strip()
+        if not message:
+            return Response({"detail": "Message is required"}, status=400)
+
+        thread, start_date, end_date = self.start_turn(request, organization, message)
+
+        events = stream_chat_response(
             organization_id=organization.id,
             thread=thread,
             message=message,
@@ -66,14 +112,15 @@ class ChatView(OrganizationRequiredMixin, APIView):
             end_date=end_date,
         )
 
-        return Response(
-            {
-                "thread_id": thread.id,
-                "assistant_message": payload["answer"],
-                "citations": payload["citations"],
-                "follow_ups": payload["follow_ups"],
-            }
-        )
+        def event_stream():
+            yield _sse({"type": "thread", "thread_id": thread.id})
+            for event in events:
+                yield _sse(event)
+
+        response = StreamingHttpResponse(event_stream(), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
 
 
 class ThreadDetailView(OrganizationRequiredMixin, APIView):
@@ -84,7 +131,14 @@ class ThreadDetailView(OrganizationRequiredMixin, APIView):
         if not organization:
             return Response({"detail": "Organization required"}, status=400)
 
-        thread = ChatThread.objects.filter(id=thread_id, organization=organization).first()
+        messages = ChatMessage.objects.order_by("created_at").only(
+            "id", "thread", "role", "content", "citations", "created_at"
+        )
+        thread = (
+            ChatThread.objects.filter(id=thread_id, organization=organization)
+            .prefetch_related(Prefetch("messages", queryset=messages), "citations")
+            .first()
+        )
         if not thread:
             return Response({"detail": "Thread not found"}, status=404)
 
@@ -1,31 +1,43 @@
 """WebSocket consumers for AI chat."""
 
+import asyncio
 from datetime import date
+from functools import lru_cache
 
-from channels.generic.websocket import JsonWebsocketConsumer
-from django.utils import timezone
+from asgiref.sync import sync_to_async
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
-from apps.accounts.models import Organization
+from apps.accounts.cache import get_cached_organization, get_user_id
 from apps.core.authentication import ClerkJWTAuthentication
 from apps.ai.models import ChatThread, ChatMessage
 from apps.ai.services.chat import (
+    AnswerStreamDecoder,
     compute_facts,
     build_context,
     build_response_payload,
     parse_llm_json,
 )
-from apps.ai.services.openai_client import get_openai_client
-from apps.ai.services.rag import default_date_range, retrieve_documents, ensure_documents
+from apps.ai.services.openai_client import get_async_openai_client
+from apps.ai.services.rag import default_date_range, find_relevant_documents
+from apps.ai.tasks import persist_assistant_message
 from django.conf import settings
 
+TOKEN_FLUSH_INTERVAL = 0.05  # seconds
 
-class AIChatConsumer(JsonWebsocketConsumer):
-    """Streams AI chat responses over WebSocket."""
 
-    def connect(self):
-        self.user = None
+class AIChatConsumer(AsyncJsonWebsocketConsumer):
+    """
+    Streams AI chat responses over WebSocket.
+
+    Runs on the event loop so an open LLM stream doesn't hold a worker thread;
+    ORM work is pushed to the thread pool with database_sync_to_async.
+    """
+
+    async def connect(self):
+        self.user_id = None
         self.organization = None
-        self.accept()
+        await self.accept()
 
     def _authenticate(self, token: str) -> bool:
         if not token:
@@ -42,27 +54,28 @@ class AIChatConsumer(JsonWebsocketConsumer):
         if not clerk_id or not org_id:
             return False
 
-        user = auth._get_or_create_user(clerk_id, payload)
-        try:
-            organization = Organization.objects.get(clerk_org_id=org_id)
-        except Organization.DoesNotExist:
+        user_id = get_user_id(clerk_id)
+        if user_id is None:
+            user_id = auth._get_or_create_user(clerk_id, payload).pk
+        organization = get_cached_organization(org_id)
+        if not organization:
             return False
 
-        self.user = user
+        self.user_id = user_id
         self.organization = organization
         return True
 
-    def receive_json(self, content, **kwargs):
+    async def receive_json(self, content, **kwargs):
         if not self.organization:
             token = content.get("token")
-            if not self._authenticate(token):
-                self.send_json({"type": "error", "message": "Unauthorized"})
-                self.close()
+            if not await database_sync_to_async(self._authenticate)(token):
+                await self.send_json({"type": "error", "message": "Unauthorized"})
+                await self.close()
                 return
 
         message = (content.get("message") or "").strip()
         if not message:
-            self.send_json({"type": "error", "message": "Message is required"})
+            await self.send_json({"type": "error", "message": "Message is required"})
             return
 
         date_range = content.get("date_range") or {}
@@ -72,30 +85,33 @@ class AIChatConsumer(JsonWebsocketConsumer):
         thread_id = content.get("thread_id")
         thread = None
         if thread_id:
-            thread = ChatThread.objects.filter(id=thread_id, organization=self.organization).first()
+            thread = await ChatThread.objects.filter(id=thread_id, organization=self.organization).afirst()
         if not thread:
-            thread = ChatThread.objects.create(
+            thread = await ChatThread.objects.acreate(
                 organization=self.organization,
-                created_by=self.user,
+                created_by_id=self.user_id,
                 title="AI Insights",
                 default_start_date=start_date,
                 default_end_date=end_date,
             )
 
-        ChatMessage.objects.create(
-            thread=thread,
-            role=ChatMessage.Role.USER,
-            content=message,
-        )
+        # Saved before generating so the turn is recorded even if the stream fails
+        await ChatMessage.objects.acreate(thread=thread, role=ChatMessage.Role.USER, content=message)
 
-        self.send_json({"type": "thread", "thread_id": thread.id})
+        await self.send_json({"type": "thread", "thread_id": thread.id})
 
         if not start_date or not end_date:
             start_date, end_date = default_date_range()
 
-        facts = compute_facts(self.organization.id, start_date, end_date)
-        ensure_documents(self.organization.id, start_date, end_date)
-        documents = retrieve_documents(self.organization.id, message, start_date, end_date)
+        # thread_sensitive=False lets both run in parallel executor threads
+        facts, documents = await asyncio.gather(
+            database_sync_to_async(compute_facts, thread_sensitive=False)(
+                self.organization.id, start_date, end_date
+            ),
+            database_sync_to_async(find_relevant_documents, thread_sensitive=False)(
+                self.organization.id, message, start_date, end_date
+            ),
+        )
         context = build_context(facts, documents)
 
         if facts.get("data_points", 0) == 0:
@@ -104,21 +120,7 @@ class AIChatConsumer(JsonWebsocketConsumer):
                 facts,
                 documents,
             )
-            ChatMessage.objects.create(
-                thread=thread,
-                role=ChatMessage.Role.ASSISTANT,
-                content=payload["answer"],
-                citations=payload["citations"],
-                model=settings.OPENAI_CHAT_MODEL,
-            )
-            thread.last_message_at = timezone.now()
-            thread.save(update_fields=["last_message_at"])
-            self.send_json({
-                "type": "final",
-                "message": payload["answer"],
-                "citations": payload["citations"],
-                "follow_ups": payload["follow_ups"],
-            })
+            await self._send_final(thread, payload)
             return
 
         if not settings.OPENAI_API_KEY:
@@ -127,25 +129,11 @@ class AIChatConsumer(JsonWebsocketConsumer):
                 facts,
                 documents,
             )
-            ChatMessage.objects.create(
-                thread=thread,
-                role=ChatMessage.Role.ASSISTANT,
-                content=payload["answer"],
-                citations=payload["citations"],
-                model=settings.OPENAI_CHAT_MODEL,
-            )
-            thread.last_message_at = timezone.now()
-            thread.save(update_fields=["last_message_at"])
-            self.send_json({
-                "type": "final",
-                "message": payload["answer"],
-                "citations": payload["citations"],
-                "follow_ups": payload["follow_ups"],
-            })
+            await self._send_final(thread, payload)
             return
 
-        client = get_openai_client()
-        stream = client.chat.completions.create(
+        client = get_async_openai_client()
+        stream = await client.chat.completions.create(
             model=settings.OPENAI_CHAT_MODEL,
             messages=[
                 {"role": "system", "content": context},
@@ -156,40 +144,51 @@ class AIChatConsumer(JsonWebsocketConsumer):
             stream=True,
         )
 
-        content_accum = ""
-        for chunk in stream:
+        # Coalesce decoded answer text into one "token" frame per TOKEN_FLUSH_INTERVAL
+        loop = asyncio.get_running_loop()
+        decoder = AnswerStreamDecoder()
+        chunks = []
+        pending = []
+        last_flush = loop.time()
+        async for chunk in stream:
             delta = chunk.choices[0].delta
             if delta and delta.content:
-                content_accum += delta.content
-                self.send_json({"type": "token", "text": delta.content})
-
-        parsed = parse_llm_json(content_accum)
+                chunks.append(delta.content)
+                pending.append(decoder.feed(delta.content))
+                if loop.time() - last_flush >= TOKEN_FLUSH_INTERVAL and any(pending):
+                    await self.send_json({"type": "token", "text": "".join(pending)})
+                    pending.clear()
+                    last_flush = loop.time()
+        if any(pending):
+            await self.send_json({"type": "token", "text": "".join(pending)})
+
+        parsed = parse_llm_json("".join(chunks))
         payload = build_response_payload(parsed.get("answer", ""), facts, documents)
         payload["follow_ups"] = parsed.get("follow_ups", payload["follow_ups"])
 
-        ChatMessage.objects.create(
-            thread=thread,
-            role=ChatMessage.Role.ASSISTANT,
-            content=payload["answer"],
-            citations=payload["citations"],
-            model=settings.OPENAI_CHAT_MODEL,
-        )
-
-        thread.last_message_at = timezone.now()
-        thread.save(update_fields=["last_message_at"])
+        await self._send_final(thread, payload)
 
-        self.send_json({
+    async def _send_final(self, thread: ChatThread, payload: dict) -> None:
+        """Send the final answer, then queue the reply to be saved off the socket thread."""
+        await self.send_json({
             "type": "final",
             "message": payload["answer"],
             "citations": payload["citations"],
             "follow_ups": payload["follow_ups"],
         })
+        await sync_to_async(persist_assistant_message.delay)(
+            thread.id,
+            payload["answer"],
+            payload["citations"],
+            settings.OPENAI_CHAT_MODEL,
+        )
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _parse_date(value: str | None) -> date | None:
         if not value:
             return None
         try:
-            return timezone.datetime.strptime(value, "%Y-%m-%d").date()
+            return date.fromisoformat(value)
         except ValueError:
             return None
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.8 on 2026-10-16 11:05
+
+from django.db import migrations, models
+
+
+def delete_duplicate_documents(apps, schema_editor):
+    """Keep only the newest document per organization, type and period."""
+    RagDocument = apps.get_model("ai", "RagDocument")
+    seen = set()
+    duplicate_ids = []
+    rows = RagDocument.objects.order_by("-id").values_list(
+        "id", "organization_id", "doc_type", "start_date", "end_date"
+    )
+    for doc_id, *period in rows.iterator():
+        period = tuple(period)
+        if period in seen:
+            duplicate_ids.append(doc_id)
+        else:
+            seen.add(period)
+    RagDocument.objects.filter(id__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_documents, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="ragdocument",
+            name="ai_ragdoc_organiz_9c6f1c_idx",
+        ),
+        migrations.AddConstraint(
+            model_name="ragdocument",
+            constraint=models.UniqueConstraint(
+                fields=("organization", "doc_type", "start_date", "end_date"),
+                name="uniq_rag_doc_period",
+            ),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.1.8 on 2026-10-16 11:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0002_remove_ragdocument_ai_ragdoc_organiz_9c6f1c_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChatThreadCitation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("source", models.CharField(max_length=120)),
+                ("label", models.CharField(max_length=255)),
+                ("data", models.JSONField(blank=True, default=dict)),
+                ("content_hash", models.CharField(max_length=64)),
+                (
+                    "thread",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="citations",
+                        to="ai.chatthread",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Chat Thread Citation",
+                "verbose_name_plural": "Chat Thread Citations",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("thread", "content_hash"), name="uniq_thread_citation"
+                    )
+                ],
+            },
+        ),
+    ]
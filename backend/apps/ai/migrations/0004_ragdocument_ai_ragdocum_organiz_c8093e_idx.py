@@ -0,0 +1,20 @@
+# Generated by Django 5.1.8 on 2026-10-16 12:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0003_chatthreadcitation"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ragdocument",
+            index=models.Index(
+                fields=["organization", "start_date", "end_date"],
+                name="ai_ragdocum_organiz_c8093e_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.8 on 2026-10-16 12:35
+
+import pgvector.django.halfvec
+import pgvector.django.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai", "0004_ragdocument_ai_ragdocum_organiz_c8093e_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="ragdocument",
+            name="rag_doc_embedding_hnsw",
+        ),
+        migrations.AlterField(
+            model_name="ragdocument",
+            name="embedding",
+            field=pgvector.django.halfvec.HalfVectorField(
+                blank=True, dimensions=1536, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ragdocument",
+            index=pgvector.django.indexes.HnswIndex(
+                ef_construction=200,
+                fields=["embedding"],
+                m=16,
+                name="rag_doc_embedding_hnsw",
+                opclasses=["halfvec_cosine_ops"],
+            ),
+        ),
+    ]
@@ -2,7 +2,7 @@
 
 from django.conf import settings
 from django.db import models
-from pgvector.django import VectorField, HnswIndex
+from pgvector.django import HalfVectorField, HnswIndex
 
 from apps.core.models import TimeStampedModel
 from apps.accounts.models import Organization, User
@@ -25,19 +25,27 @@ class RagDocument(TimeStampedModel):
     content = models.TextField()
     content_hash = models.CharField(max_length=64, db_index=True)
     metadata = models.JSONField(default=dict, blank=True)
-    embedding = VectorField(dimensions=settings.AI_EMBEDDING_DIM, null=True, blank=True)
+    # Stored as FP16 (halfvec); OpenAI's FP32 vectors are cast on write
+    embedding = HalfVectorField(dimensions=settings.AI_EMBEDDING_DIM, null=True, blank=True)
 
     class Meta:
         verbose_name = "RAG Document"
         verbose_name_plural = "RAG Documents"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["organization", "doc_type", "start_date", "end_date"],
+                name="uniq_rag_doc_period",
+            ),
+        ]
         indexes = [
-            models.Index(fields=["organization", "doc_type", "start_date", "end_date"]),
+            # Pre-filter for retrieval and ensure_documents, which don't filter on doc_type
+            models.Index(fields=["organization", "start_date", "end_date"]),
             HnswIndex(
                 name="rag_doc_embedding_hnsw",
                 fields=["embedding"],
                 m=16,
                 ef_construction=200,
-                opclasses=["vector_cosine_ops"],
+                opclasses=["halfvec_cosine_ops"],
             ),
         ]
 
@@ -74,6 +82,33 @@ class ChatThread(TimeStampedModel):
         return f"{self.organization.name} - {self.title or 'Untitled Thread'}"
 
 
+class ChatThreadCitation(TimeStampedModel):
+    """A citation shared by the messages of a thread; messages store pool ids."""
+
+    thread = models.ForeignKey(
+        ChatThread,
+        on_delete=models.CASCADE,
+        related_name="citations",
+    )
+    source = models.CharField(max_length=120)
+    label = models.CharField(max_length=255)
+    data = models.JSONField(default=dict, blank=True)
+    content_hash = models.CharField(max_length=64)
+
+    class Meta:
+        verbose_name = "Chat Thread Citation"
+        verbose_name_plural = "Chat Thread Citations"
+        constraints = [
+            models.UniqueConstraint(fields=["thread", "content_hash"], name="uniq_thread_citation"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.thread_id} - {self.label}"
+
+    def as_dict(self) -> dict:
+        return {"label": self.label, "data": self.data, "source": self.source}
+
+
 class ChatMessage(TimeStampedModel):
     class Role(models.TextChoices):
         USER = "user", "User"
@@ -87,6 +122,7 @@ class ChatMessage(TimeStampedModel):
     )
     role = models.CharField(max_length=20, choices=Role.choices)
     content = models.TextField()
+    # ChatThreadCitation ids; older rows hold the citation dicts inline
     citations = models.JSONField(default=list, blank=True)
     model = models.CharField(max_length=120, blank=True)
 
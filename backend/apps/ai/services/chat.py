@@ -2,85 +2,81 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
 import json
-from datetime import date
+import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 
 from django.conf import settings
-from django.db.models import Sum
+from django.db import close_old_connections, transaction
 from django.utils import timezone
 
-from apps.analytics.models import DailyMetrics
-from apps.ai.models import ChatThread, ChatMessage
-from apps.ai.services.rag import default_date_range, retrieve_documents, ensure_documents
+from apps.ai.models import ChatThread, ChatMessage, ChatThreadCitation
+from apps.ai.services.rag import aggregate_metrics, default_date_range, find_relevant_documents
 from apps.ai.services.openai_client import get_openai_client
 
+# Runs compute_facts alongside retrieval for the synchronous chat paths
+_facts_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="chat-facts")
+
+_ANSWER_START = re.compile(r'"answer"\s*:\s*"')
+_STRING_RUN = re.compile(r'[^"\\]+')
+_JSON_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
 
 def compute_facts(organization_id: int, start_date: date, end_date: date) -> dict:
-    metrics_qs = DailyMetrics.objects.filter(
-        organization_id=organization_id,
-        date__gte=start_date,
-        date__lte=end_date,
-    )
+    return aggregate_metrics(organization_id, start_date, end_date)
 
-    aggregates = metrics_qs.aggregate(
-        total_gross_revenue=Sum("gross_revenue"),
-        total_revenue=Sum("revenue"),
-        total_refunds=Sum("total_refunds"),
-        total_orders=Sum("orders_count"),
-        total_spend=Sum("total_spend"),
-        total_expenses=Sum("total_expenses"),
-        total_new_customers=Sum("new_customers_count"),
-    )
 
-    total_sales = float(aggregates["total_revenue"] or 0)
-    total_spend = float(aggregates["total_spend"] or 0)
-    total_expenses = float(aggregates["total_expenses"] or 0)
-    total_orders = int(aggregates["total_orders"] or 0)
-    total_new_customers = int(aggregates["total_new_customers"] or 0)
+def _compute_facts_in_thread(organization_id: int, start_date: date, end_date: date) -> dict:
+    # Executor threads are reused across requests; drop a connection past its
+    # CONN_MAX_AGE or left unusable, as the request cycle does
+    close_old_connections()
+    try:
+        return compute_facts(organization_id, start_date, end_date)
+    finally:
+        close_old_connections()
 
-    net_profit = total_sales - total_spend - total_expenses
-    aov = total_sales / total_orders if total_orders > 0 else 0
-    roas = total_sales / total_spend if total_spend > 0 else 0
-    mer = (total_spend / total_sales * 100) if total_sales > 0 else 0
-    net_margin = (net_profit / total_sales * 100) if total_sales > 0 else 0
-    ncpa = total_spend / total_new_customers if total_new_customers > 0 else 0
 
-    return {
-        "total_sales": total_sales,
-        "total_spend": total_spend,
-        "total_expenses": total_expenses,
-        "total_orders": total_orders,
-        "total_new_customers": total_new_customers,
-        "net_profit": net_profit,
-        "aov": aov,
-        "roas": roas,
-        "mer": mer,
-        "net_margin": net_margin,
-        "ncpa": ncpa,
-        "data_points": metrics_qs.count(),
-    }
+def gather_context(organization_id: int, message: str, start_date: date, end_date: date) -> tuple[dict, list]:
+    """
+    Compute facts and retrieve documents concurrently.
+
+    Retrieval (which may embed and rebuild documents) stays on the calling
+    thread while the metrics aggregate runs in the executor, so the wait is
+    the slower of the two rather than their sum.
+    """
+    facts_future = _facts_executor.submit(_compute_facts_in_thread, organization_id, start_date, end_date)
+    documents = find_relevant_documents(organization_id, message, start_date, end_date)
+    return facts_future.result(), documents
+
+
+_CONTEXT_PREAMBLE = (
+    "You are a data assistant for an e-commerce analytics dashboard.\n"
+    "Answer ONLY using the provided facts and documents.\n"
+    "If a question requires missing data, respond that the data is unavailable and suggest syncing.\n"
+    "Return JSON only with keys: answer (string), citations (array), follow_ups (array of strings).\n"
+    "Each citation should include label, source, and data.\n\n"
+)
 
 
 def build_context(facts: dict, documents: list) -> str:
-    facts_block = "\n".join([
-        f"- {key}: {value}" for key, value in facts.items()
-    ])
-
-    docs_block = "\n\n".join([
-        f"[Doc: {doc.doc_type}]\n{doc.content}" for doc in documents
-    ])
-
-    return (
-        "You are a data assistant for an e-commerce analytics dashboard.\n"
-        "Answer ONLY using the provided facts and documents.\n"
-        "If a question requires missing data, respond that the data is unavailable and suggest syncing.\n"
-        "Return JSON only with keys: answer (string), citations (array), follow_ups (array of strings).\n"
-        "Each citation should include label, source, and data.\n\n"
-        "Facts:\n"
-        f"{facts_block}\n\n"
-        "Documents:\n"
-        f"{docs_block}\n"
-    )
+    max_doc_chars = settings.AI_MAX_DOC_CHARS
+
+    context = io.StringIO()
+    context.write(_CONTEXT_PREAMBLE)
+    context.write("Facts:\n")
+    context.write("\n".join(f"- {key}: {value}" for key, value in facts.items()))
+    context.write("\n\nDocuments:\n")
+    for i, doc in enumerate(documents):
+        if i:
+            context.write("\n\n")
+        context.write(f"[Doc: {doc.doc_type}]\n")
+        context.write(doc.content[:max_doc_chars])
+    context.write("\n")
+    return context.getvalue()
 
 
 def parse_llm_json(raw: str) -> dict:
@@ -94,6 +90,79 @@ def parse_llm_json(raw: str) -> dict:
         }
 
 
+class AnswerStreamDecoder:
+    """
+    Decode the "answer" string of a JSON-mode completion as it streams.
+
+    feed() returns the answer text completed by each delta, so clients can
+    render it before the object closes. parse_llm_json on the full output
+    remains the source of truth for the final payload.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._started = False
+        self._done = False
+
+    def feed(self, text: str) -> str:
+        if self._done:
+            return ""
+        self._buffer += text
+        if not self._started:
+            match = _ANSWER_START.search(self._buffer)
+            if not match:
+                return ""
+            self._started = True
+            self._buffer = self._buffer[match.end():]
+
+        buffer = self._buffer
+        out = []
+        i = 0
+        while i < len(buffer):
+            run = _STRING_RUN.match(buffer, i)
+            if run:
+                out.append(run.group())
+                i = run.end()
+                continue
+            if buffer[i] == '"':
+                self._done = True
+                break
+            # Backslash escape; stop and wait for more input if it is cut off
+            escape = buffer[i + 1:i + 2]
+            if not escape:
+                break
+            if escape != "u":
+                out.append(_JSON_ESCAPES.get(escape, escape))
+                i += 2
+                continue
+            if len(buffer) < i + 6:
+                break
+            try:
+                code = int(buffer[i + 2:i + 6], 16)
+            except ValueError:
+                code = 0xFFFD
+            if 0xD800 <= code < 0xDC00:
+                # High surrogate: combine with the following low surrogate escape
+                if len(buffer) < i + 12:
+                    break
+                try:
+                    low = int(buffer[i + 8:i + 12], 16)
+                except ValueError:
+                    low = 0
+                if buffer[i + 6:i + 8] == "\\u" and 0xDC00 <= low < 0xE000:
+                    out.append(chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)))
+                    i += 12
+                    continue
+                code = 0xFFFD
+            elif 0xDC00 <= code < 0xE000:
+                code = 0xFFFD
+            out.append(chr(code))
+            i += 6
+
+        self._buffer = buffer[i:]
+        return "".join(out)
+
+
 def build_response_payload(answer: str, facts: dict, documents: list) -> dict:
     citations = [
         {
@@ -123,6 +192,60 @@ def build_response_payload(answer: str, facts: dict, documents: list) -> dict:
     }
 
 
+def store_citations(thread_id: int, citations: list[dict]) -> list[int]:
+    """
+    Add citations to the thread's pool and return their ids in order.
+
+    Identical citations across turns share one row, so messages only store ids.
+    """
+    by_hash = {}
+    hashes = []
+    for citation in citations:
+        content_hash = hashlib.sha256(
+            json.dumps(citation, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        hashes.append(content_hash)
+        by_hash.setdefault(
+            content_hash,
+            ChatThreadCitation(
+                thread_id=thread_id,
+                source=citation.get("source", ""),
+                label=citation.get("label", ""),
+                data=citation.get("data", {}),
+                content_hash=content_hash,
+            ),
+        )
+
+    if not by_hash:
+        return []
+
+    # DO UPDATE (rather than DO NOTHING) so existing rows come back with their ids
+    ChatThreadCitation.objects.bulk_create(
+        list(by_hash.values()),
+        update_conflicts=True,
+        unique_fields=["thread", "content_hash"],
+        update_fields=["updated_at"],
+    )
+    return [by_hash[content_hash].id for content_hash in hashes]
+
+
+def save_assistant_message(thread_id: int, payload: dict, model: str | None = None) -> datetime:
+    """Store the assistant reply and bump the thread; returns the new last_message_at."""
+    now = timezone.now()
+    # One transaction for the citations, message and thread bump; the streaming
+    # and Celery paths run outside the request's ATOMIC_REQUESTS transaction
+    with transaction.atomic():
+        ChatMessage.objects.create(
+            thread_id=thread_id,
+            role=ChatMessage.Role.ASSISTANT,
+            content=payload["answer"],
+            citations=store_citations(thread_id, payload["citations"]),
+            model=model or settings.OPENAI_CHAT_MODEL,
+        )
+        ChatThread.objects.filter(id=thread_id).update(last_message_at=now)
+    return now
+
+
 def generate_chat_response(
     *,
     organization_id: int,
@@ -134,9 +257,7 @@ def generate_chat_response(
     if not start_date or not end_date:
         start_date, end_date = default_date_range()
 
-    facts = compute_facts(organization_id, start_date, end_date)
-    ensure_documents(organization_id, start_date, end_date)
-    documents = retrieve_documents(organization_id, message, start_date, end_date)
+    facts, documents = gather_context(organization_id, message, start_date, end_date)
     context = build_context(facts, documents)
 
     if facts.get("data_points", 0) == 0:
@@ -145,29 +266,13 @@ def generate_chat_response(
             facts,
             documents,
         )
-        ChatMessage.objects.create(
-            thread=thread,
-            role=ChatMessage.Role.ASSISTANT,
-            content=payload["answer"],
-            citations=payload["citations"],
-            model=settings.OPENAI_CHAT_MODEL,
-        )
-        thread.last_message_at = timezone.now()
-        thread.save(update_fields=["last_message_at"])
+        thread.last_message_at = save_assistant_message(thread.id, payload)
         return payload
 
     if not settings.OPENAI_API_KEY:
         answer = "AI is not configured yet. Please set OPENAI_API_KEY."
         payload = build_response_payload(answer, facts, documents)
-        ChatMessage.objects.create(
-            thread=thread,
-            role=ChatMessage.Role.ASSISTANT,
-            content=payload["answer"],
-            citations=payload["citations"],
-            model=settings.OPENAI_CHAT_MODEL,
-        )
-        thread.last_message_at = timezone.now()
-        thread.save(update_fields=["last_message_at"])
+        thread.last_message_at = save_assistant_message(thread.id, payload)
         return payload
 
     client = get_openai_client()
@@ -187,16 +292,7 @@ def generate_chat_response(
     payload = build_response_payload(parsed.get("answer", ""), facts, documents)
     payload["follow_ups"] = parsed.get("follow_ups", payload["follow_ups"])
 
-    ChatMessage.objects.create(
-        thread=thread,
-        role=ChatMessage.Role.ASSISTANT,
-        content=payload["answer"],
-        citations=payload["citations"],
-        model=settings.OPENAI_CHAT_MODEL,
-    )
-
-    thread.last_message_at = timezone.now()
-    thread.save(update_fields=["last_message_at"])
+    thread.last_message_at = save_assistant_message(thread.id, payload)
 
     return payload
 
@@ -208,51 +304,60 @@ def stream_chat_response(
     message: str,
     start_date: date | None = None,
     end_date: date | None = None,
-) -> tuple[str, dict]:
+) -> Iterator[dict]:
+    """
+    Yield {"type": "token"} events as the completion streams, then a "final" event.
+
+    The assistant message is saved once the stream is exhausted.
+    """
     if not start_date or not end_date:
         start_date, end_date = default_date_range()
 
-    facts = compute_facts(organization_id, start_date, end_date)
-    ensure_documents(organization_id, start_date, end_date)
-    documents = retrieve_documents(organization_id, message, start_date, end_date)
+    facts, documents = gather_context(organization_id, message, start_date, end_date)
     context = build_context(facts, documents)
 
-    if not settings.OPENAI_API_KEY:
+    if facts.get("data_points", 0) == 0:
+        payload = build_response_payload(
+            "I don't have any metrics for that date range yet. Try syncing your data and ask again.",
+            facts,
+            documents,
+        )
+    elif not settings.OPENAI_API_KEY:
         answer = "AI is not configured yet. Please set OPENAI_API_KEY."
         payload = build_response_payload(answer, facts, documents)
-        return answer, payload
-
-    client = get_openai_client()
-    stream = client.chat.completions.create(
-        model=settings.OPENAI_CHAT_MODEL,
-        messages=[
-            {"role": "system", "content": context},
-            {"role": "user", "content": message},
-        ],
-        response_format={"type": "json_object"},
-        temperature=0.2,
-        stream=True,
-    )
-
-    content = ""
-    for chunk in stream:
-        delta = chunk.choices[0].delta
-        if delta and delta.content:
-            content += delta.content
-
-    parsed = parse_llm_json(content)
-    payload = build_response_payload(parsed.get("answer", ""), facts, documents)
-    payload["follow_ups"] = parsed.get("follow_ups", payload["follow_ups"])
-
-    ChatMessage.objects.create(
-        thread=thread,
-        role=ChatMessage.Role.ASSISTANT,
-        content=payload["answer"],
-        citations=payload["citations"],
-        model=settings.OPENAI_CHAT_MODEL,
-    )
-
-    thread.last_message_at = timezone.now()
-    thread.save(update_fields=["last_message_at"])
+    else:
+        client = get_openai_client()
+        stream = client.chat.completions.create(
+            model=settings.OPENAI_CHAT_MODEL,
+            messages=[
+                {"role": "system", "content": context},
+                {"role": "user", "content": message},
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.2,
+            stream=True,
+        )
 
-    return content, payload
+        # Tokens carry only the decoded answer text, not the raw JSON
+        decoder = AnswerStreamDecoder()
+        chunks = []
+        for chunk in stream:
+            delta = chunk.choices[0].delta
+            if delta and delta.content:
+                chunks.append(delta.content)
+                text = decoder.feed(delta.content)
+                if text:
+                    yield {"type": "token", "text": text}
+
+        parsed = parse_llm_json("".join(chunks))
+        payload = build_response_payload(parsed.get("answer", ""), facts, documents)
+        payload["follow_ups"] = parsed.get("follow_ups", payload["follow_ups"])
+
+    thread.last_message_at = save_assistant_message(thread.id, payload)
+
+    yield {
+        "type": "final",
+        "message": payload["answer"],
+        "citations": payload["citations"],
+        "follow_ups": payload["follow_ups"],
+    }
@@ -1,8 +1,29 @@
 """OpenAI client utilities."""
 
+from functools import lru_cache
+
+import httpx
 from django.conf import settings
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 
+@lru_cache(maxsize=1)
 def get_openai_client() -> OpenAI:
-    return OpenAI(api_key=settings.OPENAI_API_KEY)
+    """Process-wide client so connections to the API are kept alive across requests."""
+    return OpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        http_client=httpx.Client(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_openai_client() -> AsyncOpenAI:
+    """Async counterpart of get_openai_client for the WebSocket consumer's event loop."""
+    return AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        ),
+    )
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import hashlib
 from datetime import date, timedelta
+from functools import lru_cache
 
 from django.conf import settings
-from django.db.models import Sum
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import BooleanField, Count, ExpressionWrapper, Q, Sum
 from django.utils import timezone
-from pgvector.django import CosineDistance
+from pgvector.django import CosineDistance, HalfVector
 
 from apps.analytics.models import DailyMetrics
 from apps.campaigns.models import Campaign
@@ -16,6 +19,10 @@ from apps.orders.models import Order, Refund
 from apps.ai.models import RagDocument
 from .openai_client import get_openai_client
 
+RETRIEVAL_CACHE_TTL = 600
+DOCUMENTS_READY_TTL = 300
+EMBEDDING_CACHE_TTL = 3600
+
 
 def default_date_range() -> tuple[date, date]:
     end_date = timezone.now().date()
@@ -27,21 +34,32 @@ def _hash_content(content: str) -> str:
     return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
-def _build_metrics_content(organization_id: int, start_date: date, end_date: date) -> tuple[str, dict]:
-    metrics_qs = DailyMetrics.objects.filter(
+@lru_cache(maxsize=1024)
+def _embed_query(model: str, text: str) -> tuple[float, ...]:
+    """Embed a query, memoized in-process and shared across workers via Redis."""
+    key = "v1:embed:" + _hash_content(f"{model}|{text}")
+    embedding = cache.get(key)
+    if embedding is None:
+        embedding = get_openai_client().embeddings.create(model=model, input=text).data[0].embedding
+        cache.set(key, embedding, EMBEDDING_CACHE_TTL)
+    return tuple(embedding)
+
+
+def aggregate_metrics(organization_id: int, start_date: date, end_date: date) -> dict:
+    """Daily metrics totals and ratios for a period, used as chat facts and the metrics document."""
+    aggregates = DailyMetrics.objects.filter(
         organization_id=organization_id,
         date__gte=start_date,
         date__lte=end_date,
-    )
-
-    aggregates = metrics_qs.aggregate(
-        total_gross_revenue=Sum("gross_revenue"),
+    ).aggregate(
         total_revenue=Sum("revenue"),
-        total_refunds=Sum("total_refunds"),
         total_orders=Sum("orders_count"),
         total_spend=Sum("total_spend"),
         total_expenses=Sum("total_expenses"),
         total_new_customers=Sum("new_customers_count"),
+        # COUNT(*) rather than COUNT(id): id isn't in the covering index, so
+        # counting it would send an otherwise index-only scan to the heap
+        data_points=Count("*"),
     )
 
     total_sales = float(aggregates["total_revenue"] or 0)
@@ -51,39 +69,53 @@ def _build_metrics_content(organization_id: int, start_date: date, end_date: dat
     total_new_customers = int(aggregates["total_new_customers"] or 0)
 
     net_profit = total_sales - total_spend - total_expenses
-    aov = total_sales / total_orders if total_orders > 0 else 0
-    roas = total_sales / total_spend if total_spend > 0 else 0
-    mer = (total_spend / total_sales * 100) if total_sales > 0 else 0
-    net_margin = (net_profit / total_sales * 100) if total_sales > 0 else 0
-    ncpa = total_spend / total_new_customers if total_new_customers > 0 else 0
+
+    return {
+        "total_sales": total_sales,
+        "total_spend": total_spend,
+        "total_expenses": total_expenses,
+        "total_orders": total_orders,
+        "total_new_customers": total_new_customers,
+        "net_profit": net_profit,
+        "aov": total_sales / total_orders if total_orders > 0 else 0,
+        "roas": total_sales / total_spend if total_spend > 0 else 0,
+        "mer": (total_spend / total_sales * 100) if total_sales > 0 else 0,
+        "net_margin": (net_profit / total_sales * 100) if total_sales > 0 else 0,
+        "ncpa": total_spend / total_new_customers if total_new_customers > 0 else 0,
+        "data_points": aggregates["data_points"],
+    }
+
+
+def _build_metrics_content(organization_id: int, start_date: date, end_date: date) -> tuple[str, dict]:
+    facts = aggregate_metrics(organization_id, start_date, end_date)
 
     content = (
         "Metrics summary for the selected period:\n"
-        f"Total sales: {total_sales:,.2f} SAR\n"
-        f"Total spend: {total_spend:,.2f} SAR\n"
-        f"Total expenses: {total_expenses:,.2f} SAR\n"
-        f"Net profit: {net_profit:,.2f} SAR\n"
-        f"Total orders: {total_orders}\n"
-        f"New customers: {total_new_customers}\n"
-        f"Average order value: {aov:,.2f} SAR\n"
-        f"ROAS: {roas:.2f}\n"
-        f"MER: {mer:.1f}%\n"
-        f"Net margin: {net_margin:.1f}%\n"
-        f"NCPA: {ncpa:,.2f} SAR\n"
+        f"Total sales: {facts['total_sales']:,.2f} SAR\n"
+        f"Total spend: {facts['total_spend']:,.2f} SAR\n"
+        f"Total expenses: {facts['total_expenses']:,.2f} SAR\n"
+        f"Net profit: {facts['net_profit']:,.2f} SAR\n"
+        f"Total orders: {facts['total_orders']}\n"
+        f"New customers: {facts['total_new_customers']}\n"
+        f"Average order value: {facts['aov']:,.2f} SAR\n"
+        f"ROAS: {facts['roas']:.2f}\n"
+        f"MER: {facts['mer']:.1f}%\n"
+        f"Net margin: {facts['net_margin']:.1f}%\n"
+        f"NCPA: {facts['ncpa']:,.2f} SAR\n"
     )
 
     metadata = {
-        "total_sales": total_sales,
-        "total_spend": total_spend,
-        "total_expenses": total_expenses,
-        "net_profit": net_profit,
-        "total_orders": total_orders,
-        "new_customers": total_new_customers,
-        "aov": aov,
-        "roas": roas,
-        "mer": mer,
-        "net_margin": net_margin,
-        "ncpa": ncpa,
+        "total_sales": facts["total_sales"],
+        "total_spend": facts["total_spend"],
+        "total_expenses": facts["total_expenses"],
+        "net_profit": facts["net_profit"],
+        "total_orders": facts["total_orders"],
+        "new_customers": facts["total_new_customers"],
+        "aov": facts["aov"],
+        "roas": facts["roas"],
+        "mer": facts["mer"],
+        "net_margin": facts["net_margin"],
+        "ncpa": facts["ncpa"],
     }
 
     return content, metadata
@@ -102,14 +134,19 @@ def _build_orders_content(organization_id: int, start_date: date, end_date: date
         refund_date__date__lte=end_date,
     )
 
-    total_orders = orders.count()
-    total_revenue = float(orders.aggregate(total=Sum("total_amount"))['total'] or 0)
+    order_totals = orders.aggregate(
+        total_orders=Count("id"),
+        total_revenue=Sum("total_amount"),
+        new_customers=Count("id", filter=Q(is_new_customer=True)),
+    )
+    total_orders = order_totals["total_orders"]
+    total_revenue = float(order_totals["total_revenue"] or 0)
     total_refunds = float(refunds.aggregate(total=Sum("amount"))['total'] or 0)
-    new_customers = orders.filter(is_new_customer=True).count()
+    new_customers = order_totals["new_customers"]
 
-    source_breakdown = {}
-    for source in orders.values_list("source", flat=True):
-        source_breakdown[source] = source_breakdown.get(source, 0) + 1
+    source_breakdown = dict(
+        orders.order_by().values("source").annotate(count=Count("id")).values_list("source", "count")
+    )
 
     content = (
         "Orders summary for the selected period:\n"
@@ -139,11 +176,15 @@ def _build_campaigns_content(organization_id: int, start_date: date, end_date: d
             last_sync_at__date__lte=end_date,
         )
 
-    total_spend = float(campaigns.aggregate(total=Sum("spend"))['total'] or 0)
-    total_revenue = float(campaigns.aggregate(total=Sum("revenue"))['total'] or 0)
-    avg_roas = float(campaigns.aggregate(total=Sum("roas"))['total'] or 0)
-    count = campaigns.count() or 1
-    avg_roas = avg_roas / count
+    campaign_totals = campaigns.aggregate(
+        total_spend=Sum("spend"),
+        total_revenue=Sum("revenue"),
+        total_roas=Sum("roas"),
+        count=Count("id"),
+    )
+    total_spend = float(campaign_totals["total_spend"] or 0)
+    total_revenue = float(campaign_totals["total_revenue"] or 0)
+    avg_roas = float(campaign_totals["total_roas"] or 0) / (campaign_totals["count"] or 1)
 
     top_campaigns = list(
         campaigns.order_by("-spend")
@@ -168,9 +209,20 @@ def _build_campaigns_content(organization_id: int, start_date: date, end_date: d
     return content, metadata
 
 
-def build_rag_documents(organization_id: int, start_date: date, end_date: date) -> list[RagDocument]:
-    documents = []
-
+def build_rag_documents(
+    organization_id: int,
+    start_date: date,
+    end_date: date,
+    *,
+    defer_reembed: bool = False,
+) -> list[RagDocument]:
+    """
+    Build, embed and upsert the period's documents, skipping unchanged ones.
+
+    With defer_reembed, changed documents that already have an embedding keep
+    their previous version and are refreshed by build_rag_documents_for_org,
+    so only documents with no embedding at all are embedded inline.
+    """
     builders = [
         (RagDocument.DocType.METRICS, _build_metrics_content),
         (RagDocument.DocType.ORDERS, _build_orders_content),
@@ -179,44 +231,71 @@ def build_rag_documents(organization_id: int, start_date: date, end_date: date)
 
     client = get_openai_client() if settings.OPENAI_API_KEY else None
 
+    existing = {
+        doc.doc_type: doc
+        for doc in RagDocument.objects.filter(
+            organization_id=organization_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        .defer("embedding")
+        .annotate(has_embedding=ExpressionWrapper(Q(embedding__isnull=False), output_field=BooleanField()))
+    }
+
+    documents = []
+    changed = []
+    refresh_later = False
     for doc_type, builder in builders:
         content, metadata = builder(organization_id, start_date, end_date)
         content_hash = _hash_content(content)
 
-        existing = RagDocument.objects.filter(
-            organization_id=organization_id,
-            doc_type=doc_type,
-            start_date=start_date,
-            end_date=end_date,
-        ).first()
+        doc = existing.get(doc_type)
+        if doc is not None and doc.content_hash == content_hash and (doc.has_embedding or not client):
+            documents.append(doc)
+            continue
 
-        should_reembed = existing is None or existing.content_hash != content_hash or existing.embedding is None
+        if defer_reembed and client and doc is not None and doc.has_embedding:
+            documents.append(doc)
+            refresh_later = True
+            continue
 
-        doc, _ = RagDocument.objects.update_or_create(
+        doc = RagDocument(
             organization_id=organization_id,
             doc_type=doc_type,
             start_date=start_date,
             end_date=end_date,
-            defaults={
-                "content": content,
-                "content_hash": content_hash,
-                "metadata": metadata,
-            },
+            content=content,
+            content_hash=content_hash,
+            metadata=metadata,
         )
+        documents.append(doc)
+        changed.append(doc)
 
-        if not client:
-            documents.append(doc)
-            continue
+    if refresh_later:
+        from apps.ai.tasks import build_rag_documents_for_org
 
-        if should_reembed:
-            embedding = client.embeddings.create(
-                model=settings.OPENAI_EMBEDDING_MODEL,
-                input=content,
-            ).data[0].embedding
-            doc.embedding = embedding
-            doc.save(update_fields=["embedding", "content_hash", "content", "metadata", "updated_at"])
+        build_rag_documents_for_org.delay(organization_id, start_date.isoformat(), end_date.isoformat())
 
-        documents.append(doc)
+    if not changed:
+        return documents
+
+    if client:
+        response = client.embeddings.create(
+            model=settings.OPENAI_EMBEDDING_MODEL,
+            input=[doc.content for doc in changed],
+        )
+        for doc, item in zip(changed, sorted(response.data, key=lambda item: item.index)):
+            doc.embedding = item.embedding
+
+    # Only the new or changed documents are written, in a single upsert
+    RagDocument.objects.bulk_create(
+        changed,
+        update_conflicts=True,
+        unique_fields=["organization", "doc_type", "start_date", "end_date"],
+        update_fields=["content", "content_hash", "metadata", "embedding", "updated_at"],
+    )
+    # bulk_create bypasses the post_save handler that invalidates retrievals
+    bump_retrieval_version(organization_id)
 
     return documents
 
@@ -227,10 +306,15 @@ def ensure_documents(organization_id: int, start_date: date, end_date: date) ->
         start_date=start_date,
         end_date=end_date,
     )
-    if existing.exists():
-        if settings.OPENAI_API_KEY and existing.filter(embedding__isnull=True).exists():
-            return build_rag_documents(organization_id, start_date, end_date)
-        return list(existing)
+    state = existing.aggregate(
+        total=Count("id"),
+        missing_embeddings=Count("id", filter=Q(embedding__isnull=True)),
+    )
+    if state["total"]:
+        if settings.OPENAI_API_KEY and state["missing_embeddings"]:
+            # Only the missing embeddings block the caller
+            return build_rag_documents(organization_id, start_date, end_date, defer_reembed=True)
+        return list(existing.defer("embedding"))
 
     return build_rag_documents(organization_id, start_date, end_date)
 
@@ -239,19 +323,77 @@ def retrieve_documents(organization_id: int, query: str, start_date: date, end_d
     if not settings.OPENAI_API_KEY:
         return []
 
-    client = get_openai_client()
-    embedding = client.embeddings.create(
-        model=settings.OPENAI_EMBEDDING_MODEL,
-        input=query,
-    ).data[0].embedding
+    # Quantize the query to FP16 to match the halfvec column
+    embedding = HalfVector(_embed_query(settings.OPENAI_EMBEDDING_MODEL, query))
 
-    return list(
+    documents = (
         RagDocument.objects.filter(
             organization_id=organization_id,
             start_date=start_date,
             end_date=end_date,
             embedding__isnull=False,
         )
-        .order_by(CosineDistance("embedding", embedding))
-        .all()[:k]
+        # Only the columns used to build context and citations; the ORDER BY
+        # still reads the embedding, but it isn't sent back
+        .only("id", "doc_type", "content", "metadata", "start_date", "end_date")
+        .order_by(CosineDistance("embedding", embedding))[:k]
     )
+
+    return list(documents)
+
+
+def _retrieval_version_key(organization_id: int) -> str:
+    return f"rag:{organization_id}:version"
+
+
+def bump_retrieval_version(organization_id: int) -> None:
+    """
+    Invalidate cached retrievals for an organization after its documents change.
+
+    Deferred until commit so a concurrent retrieval can't cache the old
+    documents under the new version.
+    """
+    key = _retrieval_version_key(organization_id)
+
+    def bump():
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
+
+    transaction.on_commit(bump)
+
+
+def find_relevant_documents(organization_id: int, query: str, start_date: date, end_date: date) -> list[RagDocument]:
+    """
+    ensure_documents + retrieve_documents behind a cache keyed on the question.
+
+    Keys embed a per-organization version bumped on every RagDocument save, so
+    rebuilt documents are never served from a stale entry.
+    """
+    digest = hashlib.blake2b(
+        f"{organization_id}|{start_date}|{end_date}|{query}".encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+
+    def current_version() -> int:
+        return cache.get(_retrieval_version_key(organization_id), 0)
+
+    version = current_version()
+    documents = cache.get(f"rag:{organization_id}:v{version}:{digest}")
+    if documents is None:
+        # Remembers that the period's documents were checked at this version, so
+        # new questions in the same thread skip ensure_documents' aggregate
+        ready_key = f"rag:{organization_id}:v{version}:ready:{start_date}:{end_date}"
+        if cache.get(ready_key) is None:
+            ensure_documents(organization_id, start_date, end_date)
+            # Re-read the version: ensure_documents may have just rebuilt documents
+            version = current_version()
+            cache.set(
+                f"rag:{organization_id}:v{version}:ready:{start_date}:{end_date}",
+                1,
+                DOCUMENTS_READY_TTL,
+            )
+        documents = retrieve_documents(organization_id, query, start_date, end_date)
+        cache.set(f"rag:{organization_id}:v{version}:{digest}", documents, RETRIEVAL_CACHE_TTL)
+    return documents
@@ -0,0 +1,13 @@
+"""Signal handlers keeping cached RAG retrievals fresh."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.ai.models import RagDocument
+from apps.ai.services.rag import bump_retrieval_version
+
+
+@receiver(post_save, sender=RagDocument)
+@receiver(post_delete, sender=RagDocument)
+def invalidate_rag_retrievals(sender, instance, **kwargs):
+    bump_retrieval_version(instance.organization_id)
@@ -2,14 +2,16 @@
 
 from datetime import date, timedelta
 
-from celery import shared_task
+from celery import group, shared_task
 from django.utils import timezone
 
 from apps.accounts.models import Organization
+from apps.ai.services.chat import save_assistant_message
 from apps.ai.services.rag import build_rag_documents
 
 
-@shared_task
+# Per worker; caps embedding calls while the nightly fan-out is draining
+@shared_task(rate_limit="20/s")
 def build_rag_documents_for_org(organization_id: int, start_date: str | None = None, end_date: str | None = None):
     if start_date and end_date:
         start = date.fromisoformat(start_date)
@@ -26,5 +28,13 @@ def build_rag_documents_nightly():
     end = timezone.now().date()
     start = end - timedelta(days=30)
 
-    for org in Organization.objects.all():
-        build_rag_documents(org.id, start, end)
+    # Organizations are independent, so fan out one task each across the workers
+    group(
+        build_rag_documents_for_org.s(org_id, start.isoformat(), end.isoformat())
+        for org_id in Organization.objects.values_list("id", flat=True).iterator(chunk_size=200)
+    ).apply_async()
+
+
+@shared_task
+def persist_assistant_message(thread_id: int, content: str, citations: list, model: str):
+    save_assistant_message(thread_id, {"answer": content, "citations": citations}, model)
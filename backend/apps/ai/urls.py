@@ -1,8 +1,9 @@
 from django.urls import path
 
-from apps.ai.api.views import ChatView, ThreadDetailView
+from apps.ai.api.views import ChatView, ChatStreamView, ThreadDetailView
 
 urlpatterns = [
     path("chat/", ChatView.as_view(), name="ai-chat"),
+    path("chat/stream/", ChatStreamView.as_view(), name="ai-chat-stream"),
     path("threads/<int:thread_id>/", ThreadDetailView.as_view(), name="ai-thread"),
 ]
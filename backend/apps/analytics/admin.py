@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import DailyMetrics, AdSpendDaily, PerformanceData, PlatformSpend, Metric
+from .models import DailyMetrics, DailyMetricsRollup, AdSpendDaily, PerformanceData, PlatformSpend, Metric
 
 
 @admin.register(DailyMetrics)
@@ -12,6 +12,13 @@ class DailyMetricsAdmin(admin.ModelAdmin):
     date_hierarchy = "date"
 
 
+@admin.register(DailyMetricsRollup)
+class DailyMetricsRollupAdmin(admin.ModelAdmin):
+    list_display = ["organization", "period_start", "period_end", "total_revenue", "total_spend", "updated_at"]
+    search_fields = ["organization__name"]
+    ordering = ["-period_end", "period_start"]
+
+
 @admin.register(AdSpendDaily)
 class AdSpendDailyAdmin(admin.ModelAdmin):
     list_display = ["organization", "date", "platform", "spend", "impressions", "clicks"]
@@ -1,11 +1,14 @@
 """Serializers for analytics API."""
 
+from functools import partial
+
 from rest_framework import serializers
 
+from apps.core.serializers import ReadOnlyModelSerializer
 from apps.analytics.models import DailyMetrics, AdSpendDaily, PerformanceData, PlatformSpend, Metric, Expense
 
 
-class DailyMetricsSerializer(serializers.ModelSerializer):
+class DailyMetricsSerializer(ReadOnlyModelSerializer):
     total_sales = serializers.DecimalField(
         max_digits=12, decimal_places=2, source="revenue", read_only=True
     )
@@ -36,10 +39,52 @@ class DailyMetricsSerializer(serializers.ModelSerializer):
             "last_sync_at",
             "data_source",
         ]
-        read_only_fields = fields
 
 
-class AdSpendDailySerializer(serializers.ModelSerializer):
+_datetime_field = serializers.DateTimeField()
+
+
+class DailyMetricsRowSerializer(serializers.Serializer):
+    """
+    Read-only DailyMetrics serializer for .values() rows or model instances.
+
+    Produces the same output as DailyMetricsSerializer, but builds the dict
+    directly so read paths skip DRF's per-field bind/get_attribute walk (and,
+    for list pages, model instantiation).
+    """
+
+    # Columns to select with .values()
+    VALUES = [name for name in DailyMetricsSerializer.Meta.fields if name != "total_sales"]
+    DECIMAL_FIELDS = {
+        "gross_revenue",
+        "revenue",
+        "total_refunds",
+        "average_order_value",
+        "total_expenses",
+        "total_spend",
+        "net_profit",
+        "roas",
+        "mer",
+        "net_margin",
+        "ncpa",
+    }
+
+    def to_representation(self, row):
+        get = row.__getitem__ if isinstance(row, dict) else partial(getattr, row)
+        data = {}
+        for name in DailyMetricsSerializer.Meta.fields:
+            value = get("revenue" if name == "total_sales" else name)
+            if name in self.DECIMAL_FIELDS or name == "total_sales":
+                value = f"{value:f}"
+            elif name == "date":
+                value = value.isoformat()
+            elif name == "last_sync_at":
+                value = _datetime_field.to_representation(value)
+            data[name] = value
+        return data
+
+
+class AdSpendDailySerializer(ReadOnlyModelSerializer):
     class Meta:
         model = AdSpendDaily
         fields = [
@@ -54,24 +99,21 @@ class AdSpendDailySerializer(serializers.ModelSerializer):
             "conversions",
             "synced_at",
         ]
-        read_only_fields = fields
 
 
-class PerformanceDataSerializer(serializers.ModelSerializer):
+class PerformanceDataSerializer(ReadOnlyModelSerializer):
     class Meta:
         model = PerformanceData
         fields = ["id", "date", "revenue", "spend"]
-        read_only_fields = fields
 
 
-class PlatformSpendSerializer(serializers.ModelSerializer):
+class PlatformSpendSerializer(ReadOnlyModelSerializer):
     class Meta:
         model = PlatformSpend
         fields = ["id", "platform", "percentage", "color"]
-        read_only_fields = fields
 
 
-class MetricSerializer(serializers.ModelSerializer):
+class MetricSerializer(ReadOnlyModelSerializer):
     class Meta:
         model = Metric
         fields = [
@@ -86,7 +128,6 @@ class MetricSerializer(serializers.ModelSerializer):
             "color",
             "order",
         ]
-        read_only_fields = fields
 
 
 class ExpenseSerializer(serializers.ModelSerializer):
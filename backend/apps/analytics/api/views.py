@@ -1,11 +1,12 @@
 """Views for analytics API."""
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 
-from django.db.models import Sum
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework import viewsets
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
@@ -14,19 +15,43 @@ from apps.core.permissions import (
     OrganizationRequiredMixin,
     get_request_organization,
 )
-from apps.analytics.models import (
-    DailyMetrics,
-    PerformanceData,
-    PlatformSpend,
-    Metric,
-    Expense,
-)
-from .serializers import (
-    DailyMetricsSerializer,
-    PerformanceDataSerializer,
-    PlatformSpendSerializer,
-    MetricSerializer,
-    ExpenseSerializer,
+from apps.analytics.cache import DASHBOARD_CACHE_TTL, dashboard_cache_key
+from apps.analytics.models import DailyMetrics, DailyMetricsRollup, Expense
+from .serializers import DailyMetricsRowSerializer, DailyMetricsSerializer, ExpenseSerializer
+
+# Ad platform -> (label, chart color) for the dashboard's platform spend breakdown
+PLATFORM_DISPLAY = {
+    "snapchat": ("Snapchat", "#FFFC00"),
+    "meta": ("Meta", "#0081FB"),
+    "google": ("Google", "#FBBC04"),
+    "tiktok": ("Tiktok", "#000000"),
+}
+
+# Static part of each dashboard metric card; DashboardView fills in the value
+# (and trend_type/color where they depend on it)
+METRIC_CARD_TEMPLATES = (
+    {"id": 1, "label": "Total Revenue", "unit": "SAR", "trend": 0, "trend_label": "",
+     "icon": "dollar-sign", "trend_type": "neutral", "color": "green", "order": 1},
+    {"id": 2, "label": "Total Sales", "unit": "SAR", "trend": 0, "trend_label": "",
+     "icon": "dollar-sign", "trend_type": "neutral", "color": "green", "order": 2},
+    {"id": 3, "label": "Total Spend", "unit": "SAR", "trend": 0, "trend_label": "",
+     "icon": "credit-card", "trend_type": "neutral", "color": "red", "order": 3},
+    {"id": 4, "label": "Net Profit", "unit": "SAR", "trend": 0, "trend_label": "",
+     "icon": "trending-up", "order": 4},
+    {"id": 5, "label": "Total Orders", "unit": "", "trend": 0, "trend_label": "",
+     "icon": "shopping-cart", "trend_type": "neutral", "color": "blue", "order": 5},
+    {"id": 6, "label": "Average Order Value", "unit": "SAR", "trend": 0, "trend_label": "",
+     "icon": "trending-up", "trend_type": "neutral", "color": "purple", "order": 6},
+    {"id": 7, "label": "New Customers", "unit": "", "trend": 0, "trend_label": "",
+     "icon": "users", "trend_type": "neutral", "color": "orange", "order": 7},
+    {"id": 8, "label": "Blended ROAS", "unit": "", "trend": 0, "trend_label": "",
+     "icon": "analytics", "order": 8},
+    {"id": 9, "label": "MER", "unit": "%", "trend": 0, "trend_label": "",
+     "icon": "percent", "order": 9},
+    {"id": 10, "label": "Net Margin", "unit": "%", "trend": 0, "trend_label": "",
+     "icon": "percent", "order": 10},
+    {"id": 11, "label": "NCPA", "unit": "SAR", "trend": 0, "trend_label": "",
+     "icon": "dollar-sign", "trend_type": "neutral", "color": "blue", "order": 11},
 )
 
 
@@ -35,16 +60,29 @@ def parse_date(date_str: str, default: date) -> date:
     if not date_str:
         return default
     try:
-        return timezone.datetime.strptime(date_str, "%Y-%m-%d").date()
+        return date.fromisoformat(date_str)
     except ValueError:
         return default
 
 
+class DailyMetricsCursorPagination(CursorPagination):
+    ordering = ("-date", "-id")
+    page_size = 100
+
+
 class DailyMetricsViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for daily metrics."""
 
+    # Also the schema source; list() renders with DailyMetricsRowSerializer
     serializer_class = DailyMetricsSerializer
     permission_classes = [IsOrganizationMember]
+    pagination_class = DailyMetricsCursorPagination
+
+    def list(self, request, *args, **kwargs):
+        # Plain dict rows; the cursor keeps deep pages as cheap as the first
+        queryset = self.filter_queryset(self.get_queryset()).values(*DailyMetricsRowSerializer.VALUES)
+        page = self.paginate_queryset(queryset)
+        return self.get_paginated_response(DailyMetricsRowSerializer(page, many=True).data)
 
     def get_queryset(self):
         organization = get_request_organization(self.request)
@@ -119,17 +157,31 @@ class DashboardView(OrganizationRequiredMixin, APIView):
         start_date = parse_date(request.query_params.get("start_date"), default_start)
         end_date = parse_date(request.query_params.get("end_date"), today)
 
-        # Fetch daily metrics for the date range
-        daily_metrics_qs = DailyMetrics.objects.filter(
-            organization=organization,
-            date__gte=start_date,
-            date__lte=end_date,
-        ).order_by("date")
+        key = dashboard_cache_key(organization.id, start_date, end_date)
+        cached = cache.get(key)
+        if cached is None:
+            cached = self.build_dashboard(organization, start_date, end_date, today)
+            cache.set(key, cached, DASHBOARD_CACHE_TTL)
+
+        data, rolled_up_at = cached
+        # Seconds since the totals were rolled up; null when computed live.
+        # Worked out per request so a cached response doesn't freeze it.
+        data["staleness"] = int((timezone.now() - rolled_up_at).total_seconds()) if rolled_up_at else None
+        return Response(data)
+
+    def build_dashboard(self, organization, start_date: date, end_date: date, today: date) -> tuple[dict, datetime | None]:
+        """Build the dashboard payload, with the rollup time if totals came from one."""
+        # Fetch daily metrics for the date range once; the chart, the period
+        # totals and the end-date row are all derived from these rows
+        daily_metrics = list(
+            DailyMetrics.objects.filter(
+                organization=organization,
+                date__gte=start_date,
+                date__lte=end_date,
+            ).order_by("date", "id")
+        )
 
-        today_metrics = DailyMetrics.objects.filter(
-            organization=organization,
-            date=end_date,
-        ).first()
+        today_metrics = next((dm for dm in daily_metrics if dm.date == end_date), None)
 
         # Build performance data from DailyMetrics
         performance_data = [
@@ -139,19 +191,29 @@ class DashboardView(OrganizationRequiredMixin, APIView):
                 "revenue": float(dm.revenue or 0),
                 "spend": float(dm.total_spend or 0),
             }
-            for dm in daily_metrics_qs
+            for dm in daily_metrics
         ]
 
-        # Calculate aggregate metrics for the period
-        aggregates = daily_metrics_qs.aggregate(
-            total_gross_revenue=Sum("gross_revenue"),
-            total_revenue=Sum("revenue"),  # This is now total_sales
-            total_refunds=Sum("total_refunds"),
-            total_orders=Sum("orders_count"),
-            total_spend=Sum("total_spend"),
-            total_expenses=Sum("total_expenses"),
-            total_new_customers=Sum("new_customers_count"),
-        )
+        # Standard windows ending today are read from the pre-aggregated rollup
+        rollup = None
+        if end_date == today and (end_date - start_date).days in DailyMetricsRollup.WINDOW_DAYS:
+            rollup = DailyMetricsRollup.objects.filter(
+                organization=organization,
+                period_start=start_date,
+                period_end=end_date,
+            ).first()
+
+        if rollup:
+            aggregates = {field: getattr(rollup, field) for field in DailyMetricsRollup.TOTALS}
+            rolled_up_at = rollup.updated_at
+        else:
+            # Calculate aggregate metrics for the period from the rows already loaded
+            # (total_revenue sums revenue, which is now total_sales)
+            aggregates = {
+                field: sum(getattr(dm, column) for dm in daily_metrics)
+                for field, column in DailyMetricsRollup.TOTALS.items()
+            }
+            rolled_up_at = None
 
         total_gross_revenue = aggregates["total_gross_revenue"] or Decimal("0")
         total_sales = aggregates["total_revenue"] or Decimal("0")  # revenue = total_sales
@@ -170,166 +232,59 @@ class DashboardView(OrganizationRequiredMixin, APIView):
         ncpa = total_spend / total_new_customers if total_new_customers > 0 else Decimal("0")
 
         # Build metrics cards - include all metrics the frontend expects
-        metrics_data = [
-            {
-                "id": 1,
-                "label": "Total Revenue",
-                "value": f"{total_sales:,.0f}",
-                "unit": "SAR",
-                "trend": 0,
-                "trend_label": "",
-                "icon": "dollar-sign",
-                "trend_type": "neutral",
-                "color": "green",
-                "order": 1,
-            },
+        card_values = (
+            {"value": f"{total_sales:,.0f}"},
+            {"value": f"{total_sales:,.0f}"},
+            {"value": f"{total_spend:,.0f}"},
             {
-                "id": 2,
-                "label": "Total Sales",
-                "value": f"{total_sales:,.0f}",
-                "unit": "SAR",
-                "trend": 0,
-                "trend_label": "",
-                "icon": "dollar-sign",
-                "trend_type": "neutral",
-                "color": "green",
-                "order": 2,
-            },
-            {
-                "id": 3,
-                "label": "Total Spend",
-                "value": f"{total_spend:,.0f}",
-                "unit": "SAR",
-                "trend": 0,
-                "trend_label": "",
-                "icon": "credit-card",
-                "trend_type": "neutral",
-                "color": "red",
-                "order": 3,
-            },
-            {
-                "id": 4,
-                "label": "Net Profit",
                 "value": f"{net_profit:,.0f}",
-                "unit": "SAR",
-                "trend": 0,
-                "trend_label": "",
-                "icon": "trending-up",
                 "trend_type": "up" if net_profit > 0 else "down" if net_profit < 0 else "neutral",
                 "color": "green" if net_profit > 0 else "red",
-                "order": 4,
-            },
-            {
-                "id": 5,
-                "label": "Total Orders",
-                "value": str(total_orders),
-                "unit": "",
-                "trend": 0,
-                "trend_label": "",
-                "icon": "shopping-cart",
-                "trend_type": "neutral",
-                "color": "blue",
-                "order": 5,
-            },
-            {
-                "id": 6,
-                "label": "Average Order Value",
-                "value": f"{aov:,.0f}",
-                "unit": "SAR",
-                "trend": 0,
-                "trend_label": "",
-                "icon": "trending-up",
-                "trend_type": "neutral",
-                "color": "purple",
-                "order": 6,
-            },
-            {
-                "id": 7,
-                "label": "New Customers",
-                "value": str(total_new_customers),
-                "unit": "",
-                "trend": 0,
-                "trend_label": "",
-                "icon": "users",
-                "trend_type": "neutral",
-                "color": "orange",
-                "order": 7,
             },
+            {"value": str(total_orders)},
+            {"value": f"{aov:,.0f}"},
+            {"value": str(total_new_customers)},
             {
-                "id": 8,
-                "label": "Blended ROAS",
                 "value": f"{roas:.2f}",
-                "unit": "",
-                "trend": 0,
-                "trend_label": "",
-                "icon": "analytics",
                 "trend_type": "up" if roas > 1 else "down" if roas < 1 else "neutral",
                 "color": "green" if roas > 1 else "red",
-                "order": 8,
             },
             {
-                "id": 9,
-                "label": "MER",
                 "value": f"{mer:.1f}",
-                "unit": "%",
-                "trend": 0,
-                "trend_label": "",
-                "icon": "percent",
                 "trend_type": "up" if mer < 20 else "down" if mer > 30 else "neutral",
                 "color": "green" if mer < 20 else "red",
-                "order": 9,
             },
             {
-                "id": 10,
-                "label": "Net Margin",
                 "value": f"{net_margin:.0f}",
-                "unit": "%",
-                "trend": 0,
-                "trend_label": "",
-                "icon": "percent",
                 "trend_type": "up" if net_margin > 0 else "down" if net_margin < 0 else "neutral",
                 "color": "green" if net_margin > 0 else "red",
-                "order": 10,
-            },
-            {
-                "id": 11,
-                "label": "NCPA",
-                "value": f"{ncpa:.2f}",
-                "unit": "SAR",
-                "trend": 0,
-                "trend_label": "",
-                "icon": "dollar-sign",
-                "trend_type": "neutral",
-                "color": "blue",
-                "order": 11,
             },
+            {"value": f"{ncpa:.2f}"},
+        )
+        metrics_data = [
+            {**template, **values} for template, values in zip(METRIC_CARD_TEMPLATES, card_values)
         ]
 
         # Build platform spend breakdown from spend_by_platform (ad platforms only)
         platform_spend_data = []
         if today_metrics and today_metrics.spend_by_platform:
             total = sum(today_metrics.spend_by_platform.values())
-            colors = {
-                "snapchat": "#FFFC00",
-                "meta": "#0081FB",
-                "google": "#FBBC04",
-                "tiktok": "#000000",
-            }
             for idx, (platform, amount) in enumerate(today_metrics.spend_by_platform.items()):
+                label, color = PLATFORM_DISPLAY.get(platform.lower(), (platform.capitalize(), "#888888"))
                 percentage = (amount / total * 100) if total > 0 else 0
                 platform_spend_data.append({
                     "id": idx + 1,
-                    "platform": platform.capitalize(),
+                    "platform": label,
                     "spend": float(amount),
                     "percentage": round(percentage, 1),
-                    "color": colors.get(platform.lower(), "#888888"),
+                    "color": color,
                 })
 
-        return Response({
+        return {
             "metrics": metrics_data,
             "performance": performance_data,
             "platform_spend": platform_spend_data,
-            "daily_metrics": DailyMetricsSerializer(today_metrics).data if today_metrics else None,
+            "daily_metrics": DailyMetricsRowSerializer(today_metrics).data if today_metrics else None,
             "summary": {
                 "total_gross_revenue": float(total_gross_revenue),
                 "total_sales": float(total_sales),
@@ -342,4 +297,4 @@ class DashboardView(OrganizationRequiredMixin, APIView):
                 "start_date": str(start_date),
                 "end_date": str(end_date),
             },
-        })
+        }, rolled_up_at
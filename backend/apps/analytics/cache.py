@@ -0,0 +1,35 @@
+"""Cached dashboard payloads, versioned per organization by metrics writes."""
+
+from datetime import date
+
+from django.core.cache import cache
+from django.db import transaction
+
+DASHBOARD_CACHE_TTL = 600
+
+
+def _metrics_version_key(organization_id: int) -> str:
+    return f"dash:{organization_id}:version"
+
+
+def dashboard_cache_key(organization_id: int, start_date: date, end_date: date) -> str:
+    version = cache.get(_metrics_version_key(organization_id), 0)
+    return f"dash:v1:{organization_id}:{version}:{start_date}:{end_date}"
+
+
+def bump_metrics_version(organization_id: int) -> None:
+    """
+    Invalidate an organization's cached dashboards after its metrics change.
+
+    Deferred until commit so a concurrent request can't cache the old totals
+    under the new version.
+    """
+    key = _metrics_version_key(organization_id)
+
+    def bump():
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
+
+    transaction.on_commit(bump)
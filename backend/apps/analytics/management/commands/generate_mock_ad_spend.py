@@ -1,12 +1,14 @@
 """Generate mock Snapchat ad spend data correlated with Shopify orders."""
 
 import random
-from datetime import date, timedelta
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.db.models import Sum
 from django.db.models.functions import TruncDate
+from django.utils import timezone
 
 from apps.accounts.models import Organization
 from apps.analytics.models import AdSpendDaily
@@ -33,6 +35,12 @@ class Command(BaseCommand):
             type=int,
             help="Organization ID to generate data for (default: first org with Snapchat or any org)",
         )
+        parser.add_argument(
+            "--async",
+            action="store_true",
+            dest="run_async",
+            help="Queue the generation as a Celery task instead of running it here",
+        )
 
     def handle(self, *args, **options):
         days = options["days"]
@@ -47,53 +55,76 @@ class Command(BaseCommand):
 
         self.stdout.write(f"Using organization: {organization.name} (ID: {organization.id})")
 
-        # Clear existing mock data if requested
-        if clear:
-            deleted_count, _ = AdSpendDaily.objects.filter(
-                organization=organization,
-                platform="snapchat",
-                account_id="mock_snapchat_123",
-            ).delete()
-            self.stdout.write(f"Cleared {deleted_count} existing mock Snapchat records")
-
-        # Calculate date range
-        end_date = date.today()
-        start_date = end_date - timedelta(days=days - 1)
-
-        self.stdout.write(f"Generating data from {start_date} to {end_date}")
+        if options["run_async"]:
+            from apps.analytics.tasks import generate_mock_ad_spend_task
 
-        # Fetch Shopify revenue by date
-        revenue_by_date = self._get_revenue_by_date(organization, start_date, end_date)
-
-        # Generate ad spend data
-        created_count = 0
-        updated_count = 0
-
-        current_date = start_date
-        while current_date <= end_date:
-            daily_revenue = revenue_by_date.get(current_date, Decimal("0"))
-            ad_data = self._generate_daily_ad_data(daily_revenue)
+            generate_mock_ad_spend_task.delay(organization.id, days=days, clear=clear)
+            self.stdout.write(self.style.SUCCESS("Queued mock ad spend generation"))
+            return
 
-            _, created = AdSpendDaily.objects.update_or_create(
-                organization=organization,
-                date=current_date,
-                platform="snapchat",
-                account_id="mock_snapchat_123",
-                defaults={
-                    "spend": ad_data["spend"],
-                    "currency": "SAR",
-                    "impressions": ad_data["impressions"],
-                    "clicks": ad_data["clicks"],
-                    "conversions": ad_data["conversions"],
-                },
+        # Clear, read and upsert in one transaction so a rerun either fully
+        # replaces the range or leaves it untouched
+        with transaction.atomic():
+            # Clear existing mock data if requested
+            if clear:
+                deleted_count, _ = AdSpendDaily.objects.filter(
+                    organization=organization,
+                    platform="snapchat",
+                    account_id="mock_snapchat_123",
+                ).delete()
+                self.stdout.write(f"Cleared {deleted_count} existing mock Snapchat records")
+
+            # Calculate date range
+            end_date = date.today()
+            start_date = end_date - timedelta(days=days - 1)
+
+            self.stdout.write(f"Generating data from {start_date} to {end_date}")
+
+            # Fetch Shopify revenue by date
+            revenue_by_date = self._get_revenue_by_date(organization, start_date, end_date)
+
+            # Dates that already have a row, so the upsert can report new vs updated
+            existing_dates = set(
+                AdSpendDaily.objects.filter(
+                    organization=organization,
+                    platform="snapchat",
+                    account_id="mock_snapchat_123",
+                    date__gte=start_date,
+                    date__lte=end_date,
+                ).values_list("date", flat=True)
             )
 
-            if created:
-                created_count += 1
-            else:
-                updated_count += 1
+            # Generate ad spend data
+            to_upsert = []
+
+            for current_date in (start_date + timedelta(days=i) for i in range(days)):
+                daily_revenue = revenue_by_date.get(current_date, Decimal("0"))
+                ad_data = self._generate_daily_ad_data(daily_revenue)
+
+                to_upsert.append(
+                    AdSpendDaily(
+                        organization=organization,
+                        date=current_date,
+                        platform="snapchat",
+                        account_id="mock_snapchat_123",
+                        spend=ad_data["spend"],
+                        currency="SAR",
+                        impressions=ad_data["impressions"],
+                        clicks=ad_data["clicks"],
+                        conversions=ad_data["conversions"],
+                    )
+                )
+
+            # One INSERT ... ON CONFLICT DO UPDATE for the whole range
+            AdSpendDaily.objects.bulk_create(
+                to_upsert,
+                update_conflicts=True,
+                unique_fields=["organization", "date", "platform", "account_id"],
+                update_fields=["spend", "currency", "impressions", "clicks", "conversions", "updated_at"],
+            )
 
-            current_date += timedelta(days=1)
+        updated_count = len(existing_dates)
+        created_count = len(to_upsert) - updated_count
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -141,11 +172,16 @@ class Command(BaseCommand):
         """Fetch Shopify order revenue grouped by date."""
         excluded_statuses = ["cancelled", "canceled", "refunded", "voided", "failed"]
 
+        # Half-open timestamp range in the current time zone, equivalent to the
+        # __date bounds but usable by the (organization, order_date) index
+        start_dt = timezone.make_aware(datetime.combine(start_date, time.min))
+        end_dt = timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min))
+
         revenue_data = (
             Order.objects.filter(
                 organization=organization,
-                order_date__date__gte=start_date,
-                order_date__date__lte=end_date,
+                order_date__gte=start_dt,
+                order_date__lt=end_dt,
             )
             .exclude(status__in=excluded_statuses)
             .annotate(order_day=TruncDate("order_date"))
@@ -153,7 +189,7 @@ class Command(BaseCommand):
             .annotate(total_revenue=Sum("total_amount"))
         )
 
-        return {item["order_day"]: item["total_revenue"] for item in revenue_data}
+        return dict(revenue_data.values_list("order_day", "total_revenue"))
 
     def _generate_daily_ad_data(self, daily_revenue):
         """
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.8 on 2026-10-16 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0003_dailymetrics_expenses_breakdown_and_more"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="dailymetrics",
+            name="analytics_d_organiz_ac7a9f_idx",
+        ),
+        migrations.AddIndex(
+            model_name="dailymetrics",
+            index=models.Index(
+                fields=["organization", "date"],
+                include=["revenue", "orders_count", "total_spend", "total_expenses", "new_customers_count"],
+                name="analytics_d_org_date_cov_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.1.8 on 2026-10-16 15:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0009_alter_membership_unique_together_and_more"),
+        ("analytics", "0004_dailymetrics_covering_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyMetricsRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("period_start", models.DateField()),
+                ("period_end", models.DateField()),
+                (
+                    "total_gross_revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                (
+                    "total_revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                (
+                    "total_refunds",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                ("total_orders", models.IntegerField(default=0)),
+                (
+                    "total_spend",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                (
+                    "total_expenses",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                ("total_new_customers", models.IntegerField(default=0)),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="metrics_rollups",
+                        to="accounts.organization",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Daily Metrics Rollup",
+                "verbose_name_plural": "Daily Metrics Rollups",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("organization", "period_start", "period_end"),
+                        name="uniq_metrics_rollup_period",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.8 on 2026-10-16 16:05
+
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("analytics", "0005_dailymetricsrollup"),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name="dailymetrics",
+            name="analytics_d_organiz_b23529_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="dailymetrics",
+            name="analytics_d_date_24cb73_idx",
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.8 on 2026-10-16 16:20
+
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("analytics", "0006_remove_dailymetrics_duplicate_indexes"),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name="adspenddaily",
+            name="analytics_a_organiz_c911a3_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="adspenddaily",
+            name="analytics_a_date_fbb1b4_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="adspenddaily",
+            name="analytics_a_platfor_9a49ec_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="adspenddaily",
+            name="analytics_a_account_de21fb_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="adspenddaily",
+            name="analytics_a_organiz_d4985a_idx",
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.8 on 2026-10-16 16:45
+
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("analytics", "0007_remove_adspenddaily_secondary_indexes"),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name="performancedata",
+            name="analytics_p_organiz_661ee3_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="performancedata",
+            name="analytics_p_date_1ea248_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="performancedata",
+            name="analytics_p_organiz_bbbabd_idx",
+        ),
+    ]
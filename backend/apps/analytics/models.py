@@ -54,16 +54,72 @@ class DailyMetrics(TimeStampedModel):
         verbose_name = "Daily Metrics"
         verbose_name_plural = "Daily Metrics"
         unique_together = [("organization", "date", "store_id")]
+        # organization and date already get single-column indexes from the
+        # ForeignKey and db_index=True
         indexes = [
-            models.Index(fields=["organization"]),
-            models.Index(fields=["date"]),
-            models.Index(fields=["organization", "date"]),
+            # Covers the chat/RAG metrics aggregate so it can be an index-only scan
+            models.Index(
+                fields=["organization", "date"],
+                include=["revenue", "orders_count", "total_spend", "total_expenses", "new_customers_count"],
+                name="analytics_d_org_date_cov_idx",
+            ),
         ]
 
     def __str__(self):
         return f"{self.organization.name} - {self.date}"
 
 
+class DailyMetricsRollup(TimeStampedModel):
+    """
+    DailyMetrics totals pre-aggregated for the dashboard's standard windows.
+
+    One row per organization and window ending today, refreshed by
+    calculate_daily_metrics_for_org so the dashboard can read a single row
+    instead of summing the range.
+    """
+
+    WINDOW_DAYS = (7, 30, 90)
+    # Rollup field -> DailyMetrics column it sums
+    TOTALS = {
+        "total_gross_revenue": "gross_revenue",
+        "total_revenue": "revenue",
+        "total_refunds": "total_refunds",
+        "total_orders": "orders_count",
+        "total_spend": "total_spend",
+        "total_expenses": "total_expenses",
+        "total_new_customers": "new_customers_count",
+    }
+
+    organization = models.ForeignKey(
+        Organization,
+        on_delete=models.CASCADE,
+        related_name="metrics_rollups",
+    )
+    period_start = models.DateField()
+    period_end = models.DateField()
+
+    total_gross_revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    total_revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    total_refunds = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    total_orders = models.IntegerField(default=0)
+    total_spend = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    total_expenses = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    total_new_customers = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Daily Metrics Rollup"
+        verbose_name_plural = "Daily Metrics Rollups"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["organization", "period_start", "period_end"],
+                name="uniq_metrics_rollup_period",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.organization.name} - {self.period_start}..{self.period_end}"
+
+
 class AdSpendDaily(TimeStampedModel):
     """
     Daily ad spend per platform for detailed breakdown.
@@ -93,14 +149,9 @@ class AdSpendDaily(TimeStampedModel):
     class Meta:
         verbose_name = "Ad Spend Daily"
         verbose_name_plural = "Ad Spend Daily"
+        # Every query is organization-scoped, so the unique index (and its
+        # (organization, date) prefix) serves them; no secondary indexes needed
         unique_together = [("organization", "date", "platform", "account_id")]
-        indexes = [
-            models.Index(fields=["organization"]),
-            models.Index(fields=["date"]),
-            models.Index(fields=["platform", "date"]),
-            models.Index(fields=["account_id", "date"]),
-            models.Index(fields=["organization", "date"]),
-        ]
 
     def __str__(self):
         return f"{self.platform} - {self.date} - {self.spend}"
@@ -123,12 +174,9 @@ class PerformanceData(TimeStampedModel):
     class Meta:
         verbose_name = "Performance Data"
         verbose_name_plural = "Performance Data"
+        # The unique index is itself the (organization, date) index; organization
+        # and date also get single-column ones from the ForeignKey and db_index
         unique_together = [("organization", "date")]
-        indexes = [
-            models.Index(fields=["organization"]),
-            models.Index(fields=["date"]),
-            models.Index(fields=["organization", "date"]),
-        ]
 
     def __str__(self):
         return f"{self.organization.name} - {self.date}"
@@ -0,0 +1,10 @@
+"""Celery tasks for analytics data."""
+
+from celery import shared_task
+from django.core.management import call_command
+
+
+@shared_task
+def generate_mock_ad_spend_task(organization_id: int, days: int = 90, clear: bool = False):
+    """Run generate_mock_ad_spend on a worker instead of the calling process."""
+    call_command("generate_mock_ad_spend", org_id=organization_id, days=days, clear=clear)
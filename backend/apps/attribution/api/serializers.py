@@ -2,10 +2,11 @@
 
 from rest_framework import serializers
 
+from apps.core.serializers import ReadOnlyModelSerializer
 from apps.attribution.models import PixelEvent, ClickTracking, AttributionEvent
 
 
-class PixelEventSerializer(serializers.ModelSerializer):
+class PixelEventSerializer(ReadOnlyModelSerializer):
     class Meta:
         model = PixelEvent
         fields = [
@@ -27,7 +28,6 @@ class PixelEventSerializer(serializers.ModelSerializer):
             "match_confidence",
             "created_at",
         ]
-        read_only_fields = fields
 
 
 class PixelEventCreateSerializer(serializers.Serializer):
@@ -68,7 +68,7 @@ class PixelEventCreateSerializer(serializers.Serializer):
     pixel_version = serializers.CharField(required=False, allow_blank=True)
 
 
-class ClickTrackingSerializer(serializers.ModelSerializer):
+class ClickTrackingSerializer(ReadOnlyModelSerializer):
     class Meta:
         model = ClickTracking
         fields = [
@@ -86,10 +86,9 @@ class ClickTrackingSerializer(serializers.ModelSerializer):
             "conversion_value",
             "created_at",
         ]
-        read_only_fields = fields
 
 
-class AttributionEventSerializer(serializers.ModelSerializer):
+class AttributionEventSerializer(ReadOnlyModelSerializer):
     class Meta:
         model = AttributionEvent
         fields = [
@@ -105,4 +104,3 @@ class AttributionEventSerializer(serializers.ModelSerializer):
             "currency",
             "created_at",
         ]
-        read_only_fields = fields
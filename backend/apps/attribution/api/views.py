@@ -1,12 +1,18 @@
 """Views for attribution API."""
 
+from datetime import datetime, time, timedelta
+
 from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from redis.exceptions import RedisError
 from rest_framework import viewsets, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 from apps.core.permissions import IsOrganizationMember, get_request_organization
 from apps.accounts.models import APIKey
+from apps.attribution.buffer import buffer_pixel_event
 from apps.attribution.models import PixelEvent, ClickTracking, AttributionEvent
 from .serializers import (
     PixelEventSerializer,
@@ -16,6 +22,32 @@ from .serializers import (
 )
 
 
+def parse_timestamp_param(params, name: str) -> tuple[datetime | None, bool]:
+    """
+    Parse an ISO date or datetime query param into an aware datetime.
+
+    A bare date maps to midnight at its start and is flagged so an end bound
+    can include the whole day. Malformed values raise a 400.
+    """
+    value = params.get(name)
+    if not value:
+        return None, False
+    try:
+        parsed = parse_datetime(value)
+        is_date = False
+        if parsed is None:
+            day = parse_date(value)
+            parsed = datetime.combine(day, time.min) if day else None
+            is_date = True
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: "Expected an ISO 8601 date or datetime."})
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed, is_date
+
+
 class PixelEventViewSet(viewsets.ModelViewSet):
     """
     ViewSet for pixel events.
@@ -36,7 +68,12 @@ class PixelEventViewSet(viewsets.ModelViewSet):
         organization = get_request_organization(self.request)
         if not organization:
             return PixelEvent.objects.none()
-        return PixelEvent.objects.filter(organization=organization).order_by("-timestamp")
+        queryset = PixelEvent.objects.filter(organization=organization)
+        if self.action in ("list", "retrieve"):
+            # Skip the wide columns (user_agent, event_data, referrer...) the
+            # serializer never reads
+            queryset = queryset.only(*PixelEventSerializer.Meta.fields)
+        return queryset.order_by("-timestamp")
 
     def create(self, request, *args, **kwargs):
         """Create pixel event from tracking pixel."""
@@ -56,28 +93,31 @@ class PixelEventViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_401_UNAUTHORIZED,
             )
 
-        # Update last used
-        api_key_obj.last_used_at = timezone.now()
-        api_key_obj.save(update_fields=["last_used_at"])
-
         # Validate data
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
 
-        # Create pixel event
-        pixel_event = PixelEvent.objects.create(
-            organization=api_key_obj.organization,
-            timestamp=data.get("timestamp") or timezone.now(),
-            ip_address=self._get_client_ip(request),
-            user_agent=request.headers.get("User-Agent", ""),
-            **{k: v for k, v in data.items() if k != "timestamp"},
-        )
-
-        return Response(
-            PixelEventSerializer(pixel_event).data,
-            status=status.HTTP_201_CREATED,
-        )
+        # Buffer the event; flush_pixel_events bulk-inserts it and bumps
+        # the key's last_used_at
+        event = {
+            **data,
+            "organization_id": api_key_obj.organization_id,
+            "timestamp": data.get("timestamp") or timezone.now(),
+            "ip_address": self._get_client_ip(request),
+            "user_agent": request.headers.get("User-Agent", ""),
+        }
+        try:
+            buffered = buffer_pixel_event({**event, "api_key_id": api_key_obj.id})
+        except RedisError:
+            buffered = False
+        if not buffered:
+            # No Redis buffer (unavailable, or a non-Redis cache backend);
+            # fall back to a direct insert
+            PixelEvent.objects.create(**event)
+            APIKey.objects.filter(id=api_key_obj.id).update(last_used_at=timezone.now())
+
+        return Response({"status": "queued"}, status=status.HTTP_202_ACCEPTED)
 
     def _get_client_ip(self, request):
         """Extract client IP from request."""
@@ -118,13 +158,15 @@ class AttributionEventViewSet(viewsets.ReadOnlyModelViewSet):
         if source:
             queryset = queryset.filter(source=source)
 
-        # Filter by date range
-        start_date = self.request.query_params.get("start_date")
-        end_date = self.request.query_params.get("end_date")
+        # Filter by date range; a date-only end_date includes that whole day
+        start, _ = parse_timestamp_param(self.request.query_params, "start_date")
+        end, end_is_date = parse_timestamp_param(self.request.query_params, "end_date")
 
-        if start_date:
-            queryset = queryset.filter(timestamp__gte=start_date)
-        if end_date:
-            queryset = queryset.filter(timestamp__lte=end_date)
+        if start:
+            queryset = queryset.filter(timestamp__gte=start)
+        if end and end_is_date:
+            queryset = queryset.filter(timestamp__lt=end + timedelta(days=1))
+        elif end:
+            queryset = queryset.filter(timestamp__lte=end)
 
         return queryset.order_by("-timestamp")
@@ -0,0 +1,48 @@
+"""Redis buffer for incoming pixel events, flushed to the database in batches."""
+
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django_redis import get_redis_connection
+
+# Raw Redis key (the cache KEY_PREFIX is not applied to direct connections)
+PIXEL_EVENT_BUFFER_KEY = "luca:pixel_events:buffer"
+
+
+def buffer_available() -> bool:
+    """Whether the default cache is django-redis, i.e. has a raw Redis client to buffer in."""
+    return settings.CACHES["default"]["BACKEND"].startswith("django_redis.")
+
+
+def buffer_pixel_event(payload: dict) -> bool:
+    """
+    Append a validated pixel event to the buffer.
+
+    Returns False without buffering when there is no Redis cache (local and
+    test settings use LocMemCache); the caller then writes the event directly.
+    """
+    if not buffer_available():
+        return False
+    get_redis_connection("default").rpush(
+        PIXEL_EVENT_BUFFER_KEY, json.dumps(payload, cls=DjangoJSONEncoder)
+    )
+    return True
+
+
+def pop_pixel_events(limit: int) -> list[dict]:
+    """Atomically take up to `limit` of the oldest buffered events."""
+    pipe = get_redis_connection("default").pipeline(transaction=True)
+    pipe.lrange(PIXEL_EVENT_BUFFER_KEY, 0, limit - 1)
+    pipe.ltrim(PIXEL_EVENT_BUFFER_KEY, limit, -1)
+    raw, _ = pipe.execute()
+    return [json.loads(item) for item in raw]
+
+
+def requeue_pixel_events(events: list[dict]) -> None:
+    """Put events back at the head of the buffer, keeping their order."""
+    if events:
+        get_redis_connection("default").lpush(
+            PIXEL_EVENT_BUFFER_KEY,
+            *(json.dumps(event, cls=DjangoJSONEncoder) for event in reversed(events)),
+        )
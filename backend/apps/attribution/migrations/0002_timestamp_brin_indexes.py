@@ -0,0 +1,62 @@
+# Generated by Django 5.1.8 on 2026-10-16 17:40
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("attribution", "0001_initial"),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name="pixelevent",
+            name="attribution_timesta_b8a28f_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="clicktracking",
+            name="attribution_timesta_7cadf8_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="attributionevent",
+            name="attribution_timesta_a57e43_idx",
+        ),
+        migrations.AlterField(
+            model_name="pixelevent",
+            name="timestamp",
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name="clicktracking",
+            name="timestamp",
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name="attributionevent",
+            name="timestamp",
+            field=models.DateTimeField(),
+        ),
+        AddIndexConcurrently(
+            model_name="pixelevent",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["timestamp"], name="attribution_pixel_ts_brin"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="clicktracking",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["timestamp"], name="attribution_click_ts_brin"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="attributionevent",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["timestamp"], name="attribution_event_ts_brin"
+            ),
+        ),
+    ]
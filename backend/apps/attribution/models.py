@@ -1,5 +1,6 @@
 """Attribution models for tracking and events."""
 
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
 
 from apps.core.models import TimeStampedModel
@@ -29,7 +30,7 @@ class PixelEvent(TimeStampedModel):
     )
     store_id = models.CharField(max_length=255, db_index=True)
     event_type = models.CharField(max_length=50)
-    timestamp = models.DateTimeField(db_index=True)
+    timestamp = models.DateTimeField()
 
     # Session data
     session_id = models.CharField(max_length=255, blank=True, db_index=True)
@@ -82,7 +83,7 @@ class PixelEvent(TimeStampedModel):
             models.Index(fields=["organization"]),
             models.Index(fields=["store_id"]),
             models.Index(fields=["event_type"]),
-            models.Index(fields=["timestamp"]),
+            BrinIndex(fields=["timestamp"], name="attribution_pixel_ts_brin"),
             models.Index(fields=["session_id"]),
             models.Index(fields=["click_id"]),
             models.Index(fields=["order_id"]),
@@ -107,7 +108,7 @@ class ClickTracking(TimeStampedModel):
     store_id = models.CharField(max_length=255, db_index=True)
     platform = models.CharField(max_length=50)  # meta, snapchat, tiktok, google
     click_id = models.CharField(max_length=255, db_index=True)
-    timestamp = models.DateTimeField(db_index=True)
+    timestamp = models.DateTimeField()
     landing_page = models.URLField(max_length=2000)
     referrer = models.URLField(max_length=2000, blank=True)
 
@@ -139,7 +140,7 @@ class ClickTracking(TimeStampedModel):
             models.Index(fields=["store_id"]),
             models.Index(fields=["platform"]),
             models.Index(fields=["click_id"]),
-            models.Index(fields=["timestamp"]),
+            BrinIndex(fields=["timestamp"], name="attribution_click_ts_brin"),
             models.Index(fields=["converted"]),
             models.Index(fields=["organization", "timestamp"]),
         ]
@@ -179,7 +180,7 @@ class AttributionEvent(TimeStampedModel):
         on_delete=models.CASCADE,
         related_name="attribution_events",
     )
-    timestamp = models.DateTimeField(db_index=True)
+    timestamp = models.DateTimeField()
     amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     source = models.CharField(max_length=50, choices=Source.choices)
     campaign = models.CharField(max_length=500, blank=True)
@@ -209,7 +210,7 @@ class AttributionEvent(TimeStampedModel):
         indexes = [
             models.Index(fields=["organization"]),
             models.Index(fields=["source"]),
-            models.Index(fields=["timestamp"]),
+            BrinIndex(fields=["timestamp"], name="attribution_event_ts_brin"),
             models.Index(fields=["status"]),
             models.Index(fields=["order_id"]),
             models.Index(fields=["event_id"]),
@@ -0,0 +1,86 @@
+"""Celery tasks for attribution data."""
+
+import logging
+
+from celery import shared_task
+from django.core.cache import cache
+from django.db import DatabaseError, InterfaceError, OperationalError, transaction
+from django.utils import timezone
+
+from apps.accounts.models import APIKey
+
+from .buffer import buffer_available, pop_pixel_events, requeue_pixel_events
+from .models import PixelEvent
+
+logger = logging.getLogger(__name__)
+
+PIXEL_FLUSH_BATCH = 1000
+LAST_USED_RESOLUTION = 60
+
+
+def _insert_individually(objs: list[PixelEvent]) -> None:
+    for obj in objs:
+        # Drop any pk set by a batch that bulk_create then rolled back
+        obj.pk = None
+        try:
+            with transaction.atomic():
+                obj.save(force_insert=True)
+        except (OperationalError, InterfaceError):
+            raise
+        except DatabaseError as e:
+            logger.warning(f"Dropping buffered pixel event for organization {obj.organization_id}: {e}")
+
+
+@shared_task
+def flush_pixel_events():
+    """
+    Write buffered pixel events to the database.
+
+    Takes up to PIXEL_FLUSH_BATCH events per pass and keeps going while passes
+    come back full, so a burst drains without waiting for the next beat tick.
+    """
+    if not buffer_available():
+        # Events are written directly when there is no Redis cache
+        return 0
+
+    total = 0
+    while True:
+        events = pop_pixel_events(PIXEL_FLUSH_BATCH)
+        if not events:
+            break
+
+        objs = [
+            PixelEvent(**{k: v for k, v in event.items() if k != "api_key_id"})
+            for event in events
+        ]
+        # No ignore_conflicts: PixelEvent has no unique constraint for a
+        # replayed event to conflict on, so it would never skip anything
+        try:
+            PixelEvent.objects.bulk_create(objs, batch_size=500)
+        except (OperationalError, InterfaceError):
+            # Database unavailable; keep the events for the next tick
+            requeue_pixel_events(events)
+            raise
+        except DatabaseError:
+            # A bad row (e.g. its organization was deleted since it was
+            # buffered) fails the whole batch; insert one by one and drop
+            # the rows that still fail rather than blocking the buffer
+            _insert_individually(objs)
+
+        # last_used_at is kept to the minute: only keys not touched in the
+        # last LAST_USED_RESOLUTION seconds are updated, in one query
+        touched = [
+            api_key_id
+            for api_key_id in {event["api_key_id"] for event in events}
+            if cache.add(f"apikey_touch:{api_key_id}", 1, LAST_USED_RESOLUTION)
+        ]
+        if touched:
+            APIKey.objects.filter(id__in=touched).update(last_used_at=timezone.now())
+
+        total += len(events)
+        if len(events) < PIXEL_FLUSH_BATCH:
+            break
+
+    if total:
+        logger.info(f"Flushed {total} buffered pixel events")
+    return total
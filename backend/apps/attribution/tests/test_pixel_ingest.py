@@ -0,0 +1,88 @@
+"""Tests for the tracking pixel ingest endpoint."""
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.accounts.models import APIKey, Organization
+from apps.attribution.models import PixelEvent
+from apps.attribution.tasks import flush_pixel_events
+
+PIXEL_URL = "/api/v1/pixel-events/"
+
+
+class PixelIngestTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(name="Acme", slug="acme", clerk_org_id="org_acme")
+        cls.api_key, cls.raw_key = APIKey.create_key(cls.organization, "Pixel", None)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.payload = {
+            "store_id": "store-1",
+            "event_type": PixelEvent.EventType.PAGE_VIEW,
+            "session_id": "session-1",
+            "page_url": "https://shop.example.com/products/1",
+        }
+
+    def post(self, **headers):
+        return self.client.post(PIXEL_URL, self.payload, format="json", **headers)
+
+    def test_ingest_writes_event_without_redis(self):
+        # Test settings use LocMemCache, so the event is inserted directly
+        response = self.post(HTTP_X_API_KEY=self.raw_key, HTTP_USER_AGENT="pixel-test")
+
+        self.assertEqual(response.status_code, 202)
+        event = PixelEvent.objects.get()
+        self.assertEqual(event.organization_id, self.organization.id)
+        self.assertEqual(event.store_id, "store-1")
+        self.assertEqual(event.user_agent, "pixel-test")
+        self.assertIsNotNone(event.timestamp)
+        self.api_key.refresh_from_db()
+        self.assertIsNotNone(self.api_key.last_used_at)
+
+    def test_ingest_accepts_query_param_key(self):
+        response = self.client.post(f"{PIXEL_URL}?api_key={self.raw_key}", self.payload, format="json")
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(PixelEvent.objects.count(), 1)
+
+    def test_flush_is_noop_without_redis(self):
+        self.post(HTTP_X_API_KEY=self.raw_key)
+
+        self.assertEqual(flush_pixel_events(), 0)
+        self.assertEqual(PixelEvent.objects.count(), 1)
+
+    def test_requires_api_key(self):
+        response = self.post()
+
+        self.assertEqual(response.status_code, 401)
+        self.assertFalse(PixelEvent.objects.exists())
+
+    def test_rejects_invalid_api_key(self):
+        response = self.post(HTTP_X_API_KEY=APIKey.generate_key())
+
+        self.assertEqual(response.status_code, 401)
+        self.assertFalse(PixelEvent.objects.exists())
+
+    def test_rejects_revoked_api_key(self):
+        self.assertEqual(self.post(HTTP_X_API_KEY=self.raw_key).status_code, 202)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.api_key.revoked_at = timezone.now()
+            self.api_key.save(update_fields=["revoked_at"])
+
+        response = self.post(HTTP_X_API_KEY=self.raw_key)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(PixelEvent.objects.count(), 1)
+
+    def test_invalid_payload(self):
+        self.payload.pop("event_type")
+
+        response = self.post(HTTP_X_API_KEY=self.raw_key)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(PixelEvent.objects.exists())
@@ -2,10 +2,11 @@
 
 from rest_framework import serializers
 
+from apps.core.serializers import ReadOnlyModelSerializer
 from apps.campaigns.models import Campaign
 
 
-class CampaignSerializer(serializers.ModelSerializer):
+class CampaignSerializer(ReadOnlyModelSerializer):
     # Convert Decimal fields to float for frontend compatibility
     spend = serializers.FloatField()
     revenue = serializers.FloatField()
@@ -31,4 +32,3 @@ class CampaignSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
-        read_only_fields = fields
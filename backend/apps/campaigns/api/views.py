@@ -1,5 +1,7 @@
 """Views for campaigns API."""
 
+from django.core.cache import cache
+from django.http import HttpResponse
 from django_filters import rest_framework as filters
 from rest_framework import viewsets
 from rest_framework.decorators import action
@@ -10,7 +12,9 @@ from apps.core.permissions import (
     OrganizationRequiredMixin,
     get_request_organization,
 )
+from apps.campaigns.cache import CAMPAIGNS_CACHE_TTL, campaigns_cache_key
 from apps.campaigns.models import Campaign
+from apps.core.renderers import ORJSONRenderer
 from .serializers import CampaignSerializer
 
 
@@ -37,6 +41,27 @@ class CampaignViewSet(OrganizationRequiredMixin, viewsets.ReadOnlyModelViewSet):
             return Campaign.objects.none()
         return Campaign.objects.filter(organization=organization).order_by("-spend")
 
+    def list(self, request, *args, **kwargs):
+        """
+        List campaigns.
+
+        Rendered pages are cached per organization and query string and
+        dropped whenever a campaign changes (see apps.campaigns.signals).
+        """
+        organization = get_request_organization(request)
+        if not organization:
+            return super().list(request, *args, **kwargs)
+
+        cache_key = campaigns_cache_key(organization.id, request.query_params.urlencode())
+        payload = cache.get(cache_key)
+        if payload is not None:
+            return HttpResponse(payload, content_type="application/json")
+
+        response = super().list(request, *args, **kwargs)
+        payload = ORJSONRenderer().render(response.data)
+        cache.set(cache_key, payload, CAMPAIGNS_CACHE_TTL)
+        return HttpResponse(payload, content_type="application/json")
+
     @action(detail=False, methods=["post"])
     def sync(self, request):
         """Trigger campaign sync for all connected ad platforms."""
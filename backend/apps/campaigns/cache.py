@@ -0,0 +1,28 @@
+"""Cached campaign list pages, dropped whenever a campaign changes."""
+
+from django.core.cache import cache
+from django.db import transaction
+
+CAMPAIGNS_CACHE_TTL = 60
+
+
+def _campaigns_version_key(organization_id: int) -> str:
+    return f"campaigns:{organization_id}:version"
+
+
+def campaigns_cache_key(organization_id: int, query_string: str = "") -> str:
+    version = cache.get(_campaigns_version_key(organization_id), 0)
+    return f"campaigns:{organization_id}:{version}:{query_string}"
+
+
+def invalidate_campaigns_cache(organization_id: int) -> None:
+    """Drop every cached page of an organization's campaign list by bumping its version."""
+    key = _campaigns_version_key(organization_id)
+
+    def bump():
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
+
+    transaction.on_commit(bump)
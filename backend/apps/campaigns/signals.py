@@ -0,0 +1,13 @@
+"""Signal handlers keeping cached campaign lists fresh."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.campaigns.cache import invalidate_campaigns_cache
+from apps.campaigns.models import Campaign
+
+
+@receiver(post_save, sender=Campaign)
+@receiver(post_delete, sender=Campaign)
+def invalidate_campaign_list_cache(sender, instance, **kwargs):
+    invalidate_campaigns_cache(instance.organization_id)
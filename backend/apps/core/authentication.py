@@ -1,6 +1,8 @@
 """Clerk JWT Authentication for Django REST Framework."""
 
+import hashlib
 import logging
+import time
 from typing import Optional, Tuple
 
 import httpx
@@ -9,12 +11,28 @@ from django.conf import settings
 from django.core.cache import cache
 from rest_framework import authentication, exceptions
 
-from apps.accounts.models import User, Organization
+from apps.accounts.cache import get_cached_organization, get_cached_user
+from apps.accounts.models import User
 
 logger = logging.getLogger(__name__)
 
 JWKS_CACHE_KEY = "clerk_jwks"
 JWKS_CACHE_TTL = 3600  # 1 hour
+TOKEN_CACHE_MAX_TTL = 300  # Verified payloads are reused for at most 5 minutes
+
+# Parsed RSA public keys by kid, so each JWK is converted once per process.
+# Dropped whenever JWKS is refetched and after JWKS_CACHE_TTL, so keys Clerk
+# rotates out stop being trusted.
+_public_keys = {}
+_public_keys_expire_at = 0.0
+
+
+def _cached_public_key(kid: str):
+    global _public_keys_expire_at
+    if time.monotonic() >= _public_keys_expire_at:
+        _public_keys.clear()
+        _public_keys_expire_at = time.monotonic() + JWKS_CACHE_TTL
+    return _public_keys.get(kid)
 
 
 class ClerkJWTAuthentication(authentication.BaseAuthentication):
@@ -66,27 +84,36 @@ class ClerkJWTAuthentication(authentication.BaseAuthentication):
         }
 
         # Attach organization to request for later use
-        if org_id:
-            try:
-                organization = Organization.objects.get(clerk_org_id=org_id)
-                request.organization = organization
-            except Organization.DoesNotExist:
-                # Organization might not be synced yet
-                request.organization = None
-        else:
-            request.organization = None
+        # Organization might not be synced yet, in which case this is None
+        request.organization = get_cached_organization(org_id) if org_id else None
 
         return (user, auth_info)
 
     def _verify_token(self, token: str) -> dict:
+        """
+        Verify the JWT token, reusing the payload of a recently verified token.
+
+        Cached payloads expire no later than the token itself.
+        """
+        cache_key = "v1:jwt:" + hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+        payload = cache.get(cache_key)
+        if payload is not None:
+            return payload
+
+        payload = self._decode_token(token)
+
+        exp = payload.get("exp")
+        timeout = min(int(exp - time.time()), TOKEN_CACHE_MAX_TTL) if exp else TOKEN_CACHE_MAX_TTL
+        if timeout > 0:
+            cache.set(cache_key, payload, timeout)
+        return payload
+
+    def _decode_token(self, token: str) -> dict:
         """Verify the JWT token using Clerk's JWKS."""
         clerk_domain = settings.CLERK_DOMAIN
         if not clerk_domain:
             raise exceptions.AuthenticationFailed("Clerk domain not configured")
 
-        # Get JWKS
-        jwks = self._get_jwks(clerk_domain)
-
         # Decode token header to get kid
         try:
             unverified_header = jwt.get_unverified_header(token)
@@ -98,20 +125,14 @@ class ClerkJWTAuthentication(authentication.BaseAuthentication):
             raise exceptions.AuthenticationFailed("Token missing kid header")
 
         # Find the matching key
-        key = None
-        for jwk in jwks.get("keys", []):
-            if jwk.get("kid") == kid:
-                key = jwt.algorithms.RSAAlgorithm.from_jwk(jwk)
-                break
+        key = _cached_public_key(kid)
+        if not key:
+            key = self._load_public_key(self._get_jwks(clerk_domain), kid)
 
         if not key:
             # Refresh JWKS and try again
             cache.delete(JWKS_CACHE_KEY)
-            jwks = self._get_jwks(clerk_domain)
-            for jwk in jwks.get("keys", []):
-                if jwk.get("kid") == kid:
-                    key = jwt.algorithms.RSAAlgorithm.from_jwk(jwk)
-                    break
+            key = self._load_public_key(self._get_jwks(clerk_domain), kid)
 
         if not key:
             raise exceptions.AuthenticationFailed("No matching key found")
@@ -131,6 +152,16 @@ class ClerkJWTAuthentication(authentication.BaseAuthentication):
 
         return payload
 
+    @staticmethod
+    def _load_public_key(jwks: dict, kid: str):
+        """Parse the JWK with this kid and remember it for the process."""
+        for jwk in jwks.get("keys", []):
+            if jwk.get("kid") == kid:
+                key = jwt.algorithms.RSAAlgorithm.from_jwk(jwk)
+                _public_keys[kid] = key
+                return key
+        return None
+
     def _get_jwks(self, clerk_domain: str) -> dict:
         """Get Clerk JWKS, with caching."""
         jwks = cache.get(JWKS_CACHE_KEY)
@@ -147,16 +178,17 @@ class ClerkJWTAuthentication(authentication.BaseAuthentication):
             logger.error(f"Failed to fetch JWKS: {e}")
             raise exceptions.AuthenticationFailed("Failed to fetch JWKS")
 
+        # Fresh key set; forget keys parsed from the previous one
+        _public_keys.clear()
+
         cache.set(JWKS_CACHE_KEY, jwks, JWKS_CACHE_TTL)
         return jwks
 
     def _get_or_create_user(self, clerk_id: str, payload: dict) -> User:
         """Get or create a user from Clerk data."""
-        try:
-            user = User.objects.get(clerk_id=clerk_id)
+        user = get_cached_user(clerk_id)
+        if user is not None:
             return user
-        except User.DoesNotExist:
-            pass
 
         # Create user from token data
         # Note: Full user sync happens via Clerk webhooks
@@ -0,0 +1,27 @@
+"""Custom renderers for the API."""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Produces the same wire format as DRF's JSONRenderer. Types orjson doesn't
+    handle natively (Decimal, lazy strings, querysets) fall back to DRF's
+    encoder.
+    """
+
+    _encoder_default = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        return orjson.dumps(
+            data,
+            default=self._encoder_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
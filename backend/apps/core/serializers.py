@@ -0,0 +1,20 @@
+"""Shared serializer base classes."""
+
+from rest_framework import serializers
+
+
+class ReadOnlyModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer whose Meta.fields are all read-only.
+
+    Replaces the `read_only_fields = fields` idiom so the fields list is the
+    single source of truth.
+    """
+
+    def get_extra_kwargs(self):
+        extra_kwargs = super().get_extra_kwargs()
+        # Same as DRF's handling of Meta.read_only_fields; include_extra_kwargs
+        # then strips required/default/validators from read-only fields
+        for field_name in self.Meta.fields:
+            extra_kwargs.setdefault(field_name, {})["read_only"] = True
+        return extra_kwargs
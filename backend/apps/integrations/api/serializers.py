@@ -2,6 +2,7 @@
 
 from rest_framework import serializers
 
+from apps.core.serializers import ReadOnlyModelSerializer
 from apps.integrations.models import Integration, SyncLog
 
 
@@ -36,7 +37,7 @@ class IntegrationSerializer(serializers.ModelSerializer):
         ]
 
 
-class SyncLogSerializer(serializers.ModelSerializer):
+class SyncLogSerializer(ReadOnlyModelSerializer):
     class Meta:
         model = SyncLog
         fields = [
@@ -48,4 +49,3 @@ class SyncLogSerializer(serializers.ModelSerializer):
             "started_at",
             "completed_at",
         ]
-        read_only_fields = fields
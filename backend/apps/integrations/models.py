@@ -8,6 +8,10 @@ from apps.core.models import TimeStampedModel
 from apps.core.encryption import encrypt_token, decrypt_token
 from apps.accounts.models import Organization, User
 
+# Platform groupings used for onboarding transitions and sync scheduling
+STORE_PLATFORMS = frozenset({"salla", "shopify"})
+AD_PLATFORMS = frozenset({"meta", "google", "tiktok", "snapchat"})
+
 
 class Integration(TimeStampedModel):
     """
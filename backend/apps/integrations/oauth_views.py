@@ -8,16 +8,13 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.accounts.cache import invalidate_organization_cache
 from apps.core.permissions import IsOrganizationMember, OrganizationRequiredMixin
 from apps.integrations.services.oauth import OAuthService
-from apps.integrations.models import Integration
+from apps.integrations.models import Integration, STORE_PLATFORMS, AD_PLATFORMS
 
 logger = logging.getLogger(__name__)
 
-# Platform categories for onboarding status transitions
-STORE_PLATFORMS = {"salla", "shopify"}
-AD_PLATFORMS = {"meta", "google", "tiktok", "snapchat"}
-
 
 class OAuthConnectView(OrganizationRequiredMixin, APIView):
     """Start OAuth flow for a platform."""
@@ -137,7 +134,9 @@ class OAuthCallbackView(APIView):
 
         if platform in STORE_PLATFORMS and current_status == "pending":
             organization.onboarding_status = "store_connected"
-            organization.save(update_fields=["onboarding_status", "updated_at"])
+            organization.save(update_fields=["onboarding_status"])
+            invalidate_organization_cache(organization.clerk_org_id)
         elif platform in AD_PLATFORMS and current_status in ("pending", "store_connected"):
             organization.onboarding_status = "ads_connected"
-            organization.save(update_fields=["onboarding_status", "updated_at"])
+            organization.save(update_fields=["onboarding_status"])
+            invalidate_organization_cache(organization.clerk_org_id)
@@ -5,18 +5,23 @@ import logging
 from datetime import date, timedelta
 
 from celery import shared_task
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
 from django.utils import timezone
 
 from apps.accounts.models import Organization
-from apps.integrations.models import Integration, SyncLog
+from apps.integrations.models import Integration, SyncLog, STORE_PLATFORMS, AD_PLATFORMS
 from apps.integrations.services.platforms import get_platform_client, ShopifyClient
 from apps.campaigns.models import Campaign
-from apps.analytics.models import AdSpendDaily, DailyMetrics, Expense
+from apps.analytics.cache import bump_metrics_version
+from apps.analytics.models import AdSpendDaily, DailyMetrics, DailyMetricsRollup, Expense
 from apps.orders.models import Order, Refund
 
 logger = logging.getLogger(__name__)
 
+# Seconds a rollup refresh waits so a burst of per-date recalculations shares it
+ROLLUP_REFRESH_DELAY = 30
+
 
 @shared_task(bind=True, max_retries=3)
 def sync_ad_spend_for_integration(self, integration_id: int):
@@ -89,7 +94,7 @@ def sync_all_ad_spend():
     Runs every 30 minutes.
     """
     integrations = Integration.objects.filter(
-        platform__in=["meta", "google", "tiktok", "snapchat"],
+        platform__in=AD_PLATFORMS,
         is_connected=True,
     )
 
@@ -142,6 +147,7 @@ def sync_campaigns_for_integration(self, integration_id: int):
                     "impressions": data.impressions,
                     "clicks": data.clicks,
                     "conversions": data.conversions,
+                    "cpa": round(data.spend / data.conversions, 2) if data.conversions else 0,
                     "last_sync_at": timezone.now(),
                 },
             )
@@ -167,7 +173,7 @@ def sync_all_campaigns():
     Runs every 2 hours.
     """
     integrations = Integration.objects.filter(
-        platform__in=["meta", "google", "tiktok", "snapchat"],
+        platform__in=AD_PLATFORMS,
         is_connected=True,
     )
 
@@ -265,6 +271,72 @@ def get_expenses_for_date(organization, target_date: date) -> tuple:
     return total_expenses, expenses_breakdown
 
 
+def refresh_metrics_rollups(organization_id: int, period_end: date) -> None:
+    """
+    Upsert the dashboard rollups for every standard window ending on period_end.
+
+    All windows are summed in one query with filtered aggregates. Rollups
+    ending on earlier days are removed, since they are no longer refreshed.
+    """
+    starts = {days: period_end - timedelta(days=days) for days in DailyMetricsRollup.WINDOW_DAYS}
+
+    aggregates = DailyMetrics.objects.filter(
+        organization_id=organization_id,
+        date__gte=min(starts.values()),
+        date__lte=period_end,
+    ).aggregate(**{
+        f"{field}_{days}": models.Sum(column, filter=models.Q(date__gte=start))
+        for days, start in starts.items()
+        for field, column in DailyMetricsRollup.TOTALS.items()
+    })
+
+    DailyMetricsRollup.objects.bulk_create(
+        [
+            DailyMetricsRollup(
+                organization_id=organization_id,
+                period_start=start,
+                period_end=period_end,
+                **{field: aggregates[f"{field}_{days}"] or 0 for field in DailyMetricsRollup.TOTALS},
+            )
+            for days, start in starts.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["organization", "period_start", "period_end"],
+        update_fields=[*DailyMetricsRollup.TOTALS, "updated_at"],
+    )
+    DailyMetricsRollup.objects.filter(
+        organization_id=organization_id,
+        period_end__lt=period_end,
+    ).delete()
+
+
+def _rollups_queued_key(organization_id: int) -> str:
+    return f"rollups:{organization_id}:queued"
+
+
+def schedule_metrics_rollups_refresh(organization_id: int) -> None:
+    """
+    Queue one rollup refresh for the organization, ROLLUP_REFRESH_DELAY seconds out.
+
+    Further calls while it is pending are no-ops, so recalculating N days
+    (SyncNowView, an order sync fanning out per date) refreshes the rollups
+    once instead of N times.
+    """
+    def enqueue():
+        if cache.add(_rollups_queued_key(organization_id), 1, ROLLUP_REFRESH_DELAY * 2):
+            refresh_metrics_rollups_for_org.apply_async((organization_id,), countdown=ROLLUP_REFRESH_DELAY)
+
+    transaction.on_commit(enqueue)
+
+
+@shared_task
+def refresh_metrics_rollups_for_org(organization_id: int):
+    # Clear the flag first so changes made during the refresh queue another one
+    cache.delete(_rollups_queued_key(organization_id))
+    refresh_metrics_rollups(organization_id, timezone.now().date())
+    bump_metrics_version(organization_id)
+
+
 @shared_task
 def calculate_daily_metrics_for_org(organization_id: int, date_str: str):
     """
@@ -373,6 +445,14 @@ def calculate_daily_metrics_for_org(organization_id: int, date_str: str):
 
     logger.info(f"Calculated daily metrics for {organization} on {target_date}")
 
+    # Keep the dashboard rollups current when the day falls inside their windows;
+    # debounced so a multi-day recalculation refreshes them once
+    today = timezone.now().date()
+    if today - timedelta(days=max(DailyMetricsRollup.WINDOW_DAYS)) <= target_date <= today:
+        schedule_metrics_rollups_refresh(organization.id)
+
+    bump_metrics_version(organization.id)
+
     if target_date == date.today():
         from apps.ai.tasks import build_rag_documents_for_org
 
@@ -475,7 +555,7 @@ def sync_all_orders():
     to catch any missed orders.
     """
     integrations = Integration.objects.filter(
-        platform__in=["salla", "shopify"],
+        platform__in=STORE_PLATFORMS,
         is_connected=True,
     )
 
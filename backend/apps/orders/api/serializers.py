@@ -1,11 +1,10 @@
 """Serializers for orders API."""
 
-from rest_framework import serializers
-
+from apps.core.serializers import ReadOnlyModelSerializer
 from apps.orders.models import Order
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(ReadOnlyModelSerializer):
     class Meta:
         model = Order
         fields = [
@@ -25,4 +24,3 @@ class OrderSerializer(serializers.ModelSerializer):
             "synced_at",
             "created_at",
         ]
-        read_only_fields = fields
@@ -24,6 +24,12 @@ CELERY_BEAT_SCHEDULE = {
         "task": "apps.integrations.tasks.sync_all_orders",
         "schedule": crontab(minute="*/15"),
     },
+    # Flush buffered pixel events every 2 seconds
+    "flush-pixel-events": {
+        "task": "apps.attribution.tasks.flush_pixel_events",
+        "schedule": 2.0,
+        "options": {"expires": 2},
+    },
     # Build RAG documents nightly
     "build-rag-documents-nightly": {
         "task": "apps.ai.tasks.build_rag_documents_nightly",
@@ -281,6 +281,10 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "apps.core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
@@ -304,6 +308,9 @@ SPECTACULAR_SETTINGS = {
 # ------------------------------------------------------------------------------
 CLERK_DOMAIN = env("CLERK_DOMAIN", default="")
 CLERK_SECRET_KEY = env("CLERK_SECRET_KEY", default="")
+CLERK_WEBHOOK_SECRET = env("CLERK_WEBHOOK_SECRET", default="")
+# Celery queue for Clerk webhook events, kept apart from the default queue
+CLERK_WEBHOOK_QUEUE = env("CLERK_WEBHOOK_QUEUE", default="webhooks")
 
 # ENCRYPTION
 # ------------------------------------------------------------------------------
@@ -316,3 +323,5 @@ OPENAI_API_KEY = env("OPENAI_API_KEY", default="")
 OPENAI_CHAT_MODEL = env("OPENAI_CHAT_MODEL", default="gpt-4.1-mini")
 OPENAI_EMBEDDING_MODEL = env("OPENAI_EMBEDDING_MODEL", default="text-embedding-3-small")
 AI_EMBEDDING_DIM = env.int("AI_EMBEDDING_DIM", default=1536)
+# Per-document cap on RAG content included in the chat prompt
+AI_MAX_DOC_CHARS = env.int("AI_MAX_DOC_CHARS", default=2000)
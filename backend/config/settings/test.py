@@ -19,12 +19,8 @@ CACHES = {
 
 # DATABASES
 # ------------------------------------------------------------------------------
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": ":memory:",
-    },
-}
+# Postgres from DATABASE_URL, as in base: the schema relies on pgvector, BRIN
+# indexes and triggers that SQLite can't create. The runner uses a test_ copy.
 
 # EMAIL
 # ------------------------------------------------------------------------------
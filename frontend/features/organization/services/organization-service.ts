@@ -1,4 +1,4 @@
-import type { ApiClient } from '@/lib/api';
+import type { ApiClient, PaginatedResponse } from '@/lib/api';
 import { mapOrganizationDto, mapOrganizationMembersDto } from '../domain/mappers';
 import type { Organization, OrganizationMember, OrganizationDto, OrganizationMemberDto } from '../domain/types';
 
@@ -10,8 +10,16 @@ export function createOrganizationService(apiClient: ApiClient) {
     },
 
     async getMembers(): Promise<OrganizationMember[]> {
-      const dtos = await apiClient.get<OrganizationMemberDto[]>('/organizations/members/');
-      return mapOrganizationMembersDto(dtos);
+      // The endpoint is paginated; walk every page so large orgs aren't truncated
+      const members: OrganizationMemberDto[] = [];
+      for (let pageNumber = 1; ; pageNumber++) {
+        const page = await apiClient.get<PaginatedResponse<OrganizationMemberDto>>('/organizations/members/', {
+          params: { page: pageNumber },
+        });
+        members.push(...page.results);
+        if (!page.next) break;
+      }
+      return mapOrganizationMembersDto(members);
     },
   };
 }